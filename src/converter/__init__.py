@@ -23,6 +23,7 @@ from .types import (
     BatchConversionResult,
     ConversionResult,
     ProgressCallback,
+    ProgressReporter,
 )
 
 
@@ -50,6 +51,7 @@ __all__ = [
     "ConversionResult",
     "BatchConversionResult",
     "ProgressCallback",
+    "ProgressReporter",
     "ConversionError",
     "ValidationError",
     "ProcessingError",
@@ -9,7 +9,7 @@ import logging
 import os
 import time
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -18,7 +18,12 @@ from typing import Any
 from .exceptions import ProcessingError
 from .progress_tracker import ProgressTracker
 from .types import ProcessingStageInfo
-from .types import BatchConversionResult, ConversionResult, ProgressCallback
+from .types import (
+    BatchConversionResult,
+    ConversionOptions,
+    ConversionResult,
+    ProgressCallback,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -375,8 +380,8 @@ class BatchProcessor:
             )
 
             # Add job metadata
-            result.metadata["job_id"] = job.job_id
-            result.metadata["batch_processing"] = True
+            result.set_metadata("job_id", job.job_id)
+            result.set_metadata("batch_processing", True)
 
             return result
 
@@ -386,8 +391,8 @@ class BatchProcessor:
             # Create failed result
             failed_result = ConversionResult(success=False, input_path=job.input_path)
             failed_result.add_error(f"Job processing failed: {e}")
-            failed_result.metadata["job_id"] = job.job_id
-            failed_result.metadata["batch_processing"] = True
+            failed_result.set_metadata("job_id", job.job_id)
+            failed_result.set_metadata("batch_processing", True)
 
             return failed_result
 
@@ -484,3 +489,56 @@ class BatchProcessor:
     def get_progress_summary(self) -> dict[str, Any]:
         """Get current progress summary."""
         return self.progress_tracker.get_progress_summary()
+
+
+def run_batch(
+    paths: list[Path],
+    options: ConversionOptions,
+    convert_fn: Callable[[Path, ConversionOptions], ConversionResult],
+) -> BatchConversionResult:
+    """
+    Convert a batch of files, fanning out across processes when enabled.
+
+    HTML/PDF/DOCX generation is CPU-bound, so worker processes are used
+    rather than threads to sidestep the GIL. With parallel_processing
+    disabled, or for a single file, conversions run in-process.
+
+    Args:
+        paths: Input files to convert
+        options: Conversion options passed to every call of convert_fn
+        convert_fn: Picklable module-level function converting one file
+
+    Returns:
+        BatchConversionResult with one result per input path
+    """
+    start_time = time.perf_counter()
+    batch_result = BatchConversionResult(total_files=len(paths))
+
+    if not options.parallel_processing or len(paths) < 2:
+        for path in paths:
+            try:
+                batch_result.add_result(convert_fn(path, options))
+            except Exception as e:
+                failed_result = ConversionResult(success=False, input_path=Path(path))
+                failed_result.add_error(f"Failed to convert {path}: {e}")
+                batch_result.add_result(failed_result)
+    else:
+        max_workers = options.max_workers or os.cpu_count()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            future_to_path = {
+                executor.submit(convert_fn, path, options): path for path in paths
+            }
+
+            for future in as_completed(future_to_path):
+                path = future_to_path[future]
+                try:
+                    batch_result.add_result(future.result())
+                except Exception as e:
+                    failed_result = ConversionResult(
+                        success=False, input_path=Path(path)
+                    )
+                    failed_result.add_error(f"Failed to convert {path}: {e}")
+                    batch_result.add_result(failed_result)
+
+    batch_result.total_processing_time = time.perf_counter() - start_time
+    return batch_result
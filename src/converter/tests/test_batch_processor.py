@@ -13,9 +13,21 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from ..batch_processor import BatchProcessor
+from ..batch_processor import BatchProcessor, run_batch
 from ..exceptions import ConversionError, ProcessingError
-from ..types import BatchConversionResult, ConversionResult
+from ..types import BatchConversionResult, ConversionOptions, ConversionResult
+
+
+def _convert_stub(path: Path, options: ConversionOptions) -> ConversionResult:
+    """Picklable stand-in converter for run_batch worker processes."""
+    if path.stem == "broken":
+        raise ValueError("cannot parse")
+    return ConversionResult(
+        success=True,
+        input_path=path,
+        output_files=[path.with_suffix(f".{fmt}") for fmt in options.formats],
+        processing_time=0.1,
+    )
 
 
 class TestBatchProcessorInitialization:
@@ -484,6 +496,28 @@ class TestBatchProcessorResourceManagement:
             mock_executor.return_value.__exit__.assert_called_once()
 
 
+class TestRunBatch:
+    """Test cases for the process-pool run_batch helper."""
+
+    @pytest.mark.parametrize("parallel", [False, True], ids=["serial", "processes"])
+    def test_run_batch_collects_results(self, parallel):
+        """Test that every path yields a result and failures are recorded."""
+        paths = [Path("a.md"), Path("broken.md"), Path("c.md")]
+        options = ConversionOptions(
+            formats=["html"], parallel_processing=parallel, max_workers=2
+        )
+
+        batch_result = run_batch(paths, options, _convert_stub)
+
+        assert batch_result.total_files == 3
+        assert batch_result.successful_files == 2
+        assert batch_result.failed_files == 1
+        assert {r.input_path for r in batch_result.results} == set(paths)
+        failed = next(r for r in batch_result.results if not r.success)
+        assert "cannot parse" in failed.errors[0]
+        assert batch_result.total_processing_time > 0
+
+
 # Fixtures for pytest
 
 
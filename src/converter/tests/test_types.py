@@ -5,21 +5,42 @@ Tests data structures, protocols, validation, and type safety
 for the converter module types.
 """
 
-from dataclasses import FrozenInstanceError
+import functools
+import json
+import pickle
+import sys
+import tempfile
+from dataclasses import FrozenInstanceError, fields
 from pathlib import Path
-from typing import Any
+from typing import Any, get_origin
 
 import pytest
 
 from ..types import (
     BatchConversionResult,
+    ConversionOptions,
     ConversionResult,
     FileValidationMetrics,
     ProcessingStage,
+    ProgressReporter,
     ValidationReport,
 )
 
 
+_BASE_KWARGS: dict[str, Any] = {"success": True, "input_path": Path("test.md")}
+
+
+def _make_result(**overrides: Any) -> ConversionResult:
+    """Build a ConversionResult from the shared base kwargs plus overrides."""
+    return ConversionResult(**{**_BASE_KWARGS, **overrides})
+
+
+@functools.cache
+def _field_names(cls: type, kind: type) -> tuple[str, ...]:
+    """Names of dataclass fields on ``cls`` declared as ``kind`` or ``kind[...]``."""
+    return tuple(f.name for f in fields(cls) if (get_origin(f.type) or f.type) is kind)
+
+
 class TestConversionResult:
     """Test ConversionResult data class."""
 
@@ -39,10 +60,10 @@ class TestConversionResult:
 
         assert result.success is True
         assert result.input_path == Path("resume.md")
-        assert len(result.output_files) == 2
+        assert result.output_files == [Path("resume.html"), Path("resume.pdf")]
         assert result.processing_time == 2.5
-        assert len(result.warnings) == 1
-        assert len(result.errors) == 0
+        assert result.warnings == ["Minor formatting adjustment"]
+        assert result.errors == []
         assert result.metadata["theme"] == "professional"
 
     def test_failed_conversion_result(self):
@@ -59,53 +80,30 @@ class TestConversionResult:
 
         assert result.success is False
         assert result.input_path == Path("invalid.md")
-        assert len(result.output_files) == 0
-        assert len(result.errors) == 2
-        assert "File format not supported" in result.errors
-        assert "Parsing failed" in result.errors
-
-    def test_conversion_result_default_values(self):
-        """Test default values for ConversionResult."""
-        result = ConversionResult(success=True, input_path=Path("test.md"))
-
-        assert result.success is True
-        assert result.input_path == Path("test.md")
         assert result.output_files == []
-        assert result.processing_time == 0.0
-        assert result.warnings == []
-        assert result.errors == []
-        assert result.metadata == {}
-
-    def test_conversion_result_mutability(self):
-        """Test that ConversionResult supports required mutations."""
-        result = ConversionResult(success=True, input_path=Path("test.md"))
-
-        # Should be able to modify fields for error tracking
-        result.success = False
-        result.processing_time = 5.0
-        
-        # Verify changes were applied
-        assert result.success is False
-        assert result.processing_time == 5.0
+        assert result.errors == ["File format not supported", "Parsing failed"]
 
     def test_conversion_result_list_fields_mutable(self):
         """Test that list fields in ConversionResult are mutable."""
-        result = ConversionResult(
-            success=True,
-            input_path=Path("test.md"),
-            output_files=[Path("test.html")],
-            warnings=["warning"],
-            errors=[],
-        )
+        result = _make_result(output_files=[Path("test.html")], warnings=["warning"])
 
         # List contents should be mutable
         result.output_files.append(Path("test.pdf"))
         result.warnings.append("another warning")
         result.errors.append("an error")
 
-        assert len(result.output_files) == 2
-        assert len(result.warnings) == 2
-        assert len(result.errors) == 1
+        assert result.output_files == [Path("test.html"), Path("test.pdf")]
+        assert result.warnings == ["warning", "another warning"]
+        assert result.errors == ["an error"]
+
+    def test_add_error_marks_result_failed(self):
+        """Test that recording an error marks the conversion as failed."""
+        result = _make_result()
+
+        result.add_error("Parsing failed")
+
+        assert result.success is False
+        assert result.errors == ["Parsing failed"]
 
     def test_conversion_result_metadata_type(self):
         """Test metadata field type flexibility."""
@@ -120,15 +118,25 @@ class TestConversionResult:
             },
         }
 
-        result = ConversionResult(
-            success=True, input_path=Path("test.md"), metadata=complex_metadata
-        )
+        result = _make_result(metadata=complex_metadata)
 
         assert result.metadata["theme"] == "professional"
         assert result.metadata["formats"] == ["html", "pdf"]
         assert result.metadata["settings"]["font_size"] == 12
         assert result.metadata["processing_stats"]["parse_time"] == 0.5
 
+    def test_conversion_result_metadata_lazy(self):
+        """Test that metadata is only allocated once something is set."""
+        result = _make_result()
+
+        assert result.metadata is None
+        assert result.metadata_or_empty == {}
+
+        result.set_metadata("job_id", "job_0001")
+
+        assert result.metadata == {"job_id": "job_0001"}
+        assert result.metadata_or_empty["job_id"] == "job_0001"
+
 
 class TestBatchConversionResult:
     """Test BatchConversionResult data class."""
@@ -157,18 +165,16 @@ class TestBatchConversionResult:
         assert batch_result.total_files == 3
         assert batch_result.successful_files == 3
         assert batch_result.failed_files == 0
-        assert len(batch_result.results) == 3
+        assert batch_result.results == individual_results
         assert batch_result.total_processing_time == 4.5
         assert batch_result.summary["success_rate"] == 100.0
 
     def test_batch_result_with_failures(self):
         """Test batch result with some failures."""
         mixed_results = [
-            ConversionResult(success=True, input_path=Path("good1.md")),
-            ConversionResult(
-                success=False, input_path=Path("bad.md"), errors=["Failed"]
-            ),
-            ConversionResult(success=True, input_path=Path("good2.md")),
+            _make_result(input_path=Path("good1.md")),
+            _make_result(success=False, input_path=Path("bad.md"), errors=["Failed"]),
+            _make_result(input_path=Path("good2.md")),
         ]
 
         batch_result = BatchConversionResult(
@@ -199,6 +205,35 @@ class TestBatchConversionResult:
         expected_rate = (4 / 5) * 100
         assert batch_result.success_rate == expected_rate
 
+    def test_batch_result_add_result(self):
+        """Test that add_result records results and updates counters."""
+        batch_result = BatchConversionResult(total_files=2)
+        good = _make_result(input_path=Path("good.md"))
+        bad = _make_result(success=False, input_path=Path("bad.md"))
+
+        batch_result.add_result(good)
+        batch_result.add_result(bad)
+
+        assert batch_result.results == [good, bad]
+        assert batch_result.successful_files == 1
+        assert batch_result.failed_files == 1
+        assert batch_result.success_rate == 50.0
+
+    def test_batch_result_mean_processing_time(self):
+        """Test mean processing time across constructor, added and appended results."""
+        batch_result = BatchConversionResult(
+            total_files=3,
+            results=[_make_result(processing_time=1.0)],
+        )
+        batch_result.add_result(_make_result(processing_time=2.0))
+        batch_result.add_result(_make_result(processing_time=3.0))
+
+        assert batch_result.mean_processing_time == 2.0
+
+        batch_result.results.append(_make_result(processing_time=6.0))
+        assert batch_result.mean_processing_time == 3.0
+        assert BatchConversionResult(total_files=0).mean_processing_time == 0.0
+
     def test_batch_result_success_rate_zero_files(self):
         """Test success_rate property with zero files."""
         batch_result = BatchConversionResult(
@@ -212,36 +247,6 @@ class TestBatchConversionResult:
 
         assert batch_result.success_rate == 0.0
 
-    def test_batch_result_default_values(self):
-        """Test default values for BatchConversionResult."""
-        batch_result = BatchConversionResult(
-            total_files=5,
-            successful_files=4,
-            failed_files=1,
-            results=[],
-            total_processing_time=10.0,
-        )
-
-        assert batch_result.summary == {}
-
-    def test_batch_result_mutability(self):
-        """Test that BatchConversionResult supports required mutations."""
-        batch_result = BatchConversionResult(
-            total_files=3,
-            successful_files=2,
-            failed_files=1,
-            results=[],
-            total_processing_time=5.0,
-        )
-
-        # Should be able to modify fields for tracking
-        batch_result.total_files = 5
-        batch_result.total_processing_time = 10.0
-        
-        # Verify changes were applied
-        assert batch_result.total_files == 5
-        assert batch_result.total_processing_time == 10.0
-
 
 class TestProcessingStage:
     """Test ProcessingStage enumeration."""
@@ -348,6 +353,65 @@ class TestProgressCallback:
         assert tracker.calls[1] == ("test", 75.0, "method test", {"key": "value"})
 
 
+class TestProgressReporter:
+    """Test ProgressReporter throttling."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        """Patch the monotonic clock used by ProgressReporter."""
+        now = [1_000_000_000]
+        monkeypatch.setattr("time.monotonic_ns", lambda: now[0])
+        return now
+
+    def test_report_throttles_same_stage(self, clock):
+        """Test updates within the interval are dropped for the same stage."""
+        calls = []
+        reporter = ProgressReporter(
+            lambda *args: calls.append(args), min_interval_ns=1000
+        )
+
+        reporter.report("parsing", 10.0, "first")
+        clock[0] += 500
+        reporter.report("parsing", 20.0, "dropped")
+        clock[0] += 500
+        reporter.report("parsing", 30.0, "delivered", {"step": 3})
+
+        assert calls == [
+            ("parsing", 10.0, "first", None),
+            ("parsing", 30.0, "delivered", {"step": 3}),
+        ]
+
+    @pytest.mark.parametrize(
+        "stage,progress",
+        [("formatting", 40.0), ("parsing", 100.0)],
+    )
+    def test_report_always_delivers_transitions(self, clock, stage, progress):
+        """Test stage changes and completion bypass the throttle."""
+        calls = []
+        reporter = ProgressReporter(lambda *args: calls.append(args))
+
+        reporter.report("parsing", 10.0, "start")
+        reporter.report(stage, progress, "transition")
+
+        assert calls[-1] == (stage, progress, "transition", None)
+        assert len(calls) == 2
+
+    def test_report_without_callback(self, clock):
+        """Test dropped updates do not start a throttle window."""
+        calls = []
+        reporter = ProgressReporter(None)
+
+        reporter.report("parsing", 50.0, "ignored")
+
+        assert reporter._last_ns == 0
+        assert reporter._last_stage is None
+
+        reporter.callback = lambda *args: calls.append(args)
+        reporter.report("parsing", 60.0, "delivered")
+
+        assert calls == [("parsing", 60.0, "delivered", None)]
+
+
 class TestFileValidationMetrics:
     """Test FileValidationMetrics data class."""
 
@@ -374,9 +438,22 @@ class TestFileValidationMetrics:
         assert metrics.ats_score == 90.0
         assert metrics.formatting_score == 88.2
         assert metrics.overall_score == 87.9
-        assert len(metrics.issues) == 0
+        assert metrics.issues == []
         assert metrics.validation_details["structure"] == "good"
 
+    def test_file_validation_metrics_interns_format_type(self):
+        """Test that equal format strings share a single interned object."""
+        runtime_format = "".join(["ht", "ml"])
+
+        metrics = FileValidationMetrics(
+            file_path=Path("test.html"),
+            format_type=runtime_format,
+            file_size=1024,
+            is_valid=True,
+        )
+
+        assert metrics.format_type is sys.intern("html")
+
     def test_file_validation_metrics_with_issues(self):
         """Test FileValidationMetrics with validation issues."""
         issues = [
@@ -399,26 +476,9 @@ class TestFileValidationMetrics:
         )
 
         assert metrics.is_valid is False
-        assert len(metrics.issues) == 3
-        assert "File size too small" in metrics.issues
+        assert metrics.issues == issues
         assert metrics.overall_score == 45.0
 
-    def test_file_validation_metrics_default_values(self):
-        """Test default values for FileValidationMetrics."""
-        metrics = FileValidationMetrics(
-            file_path=Path("test.docx"),
-            format_type="docx",
-            file_size=2048,
-            is_valid=True,
-        )
-
-        assert metrics.content_score == 0.0
-        assert metrics.ats_score == 0.0
-        assert metrics.formatting_score == 0.0
-        assert metrics.overall_score == 0.0
-        assert metrics.issues == []
-        assert metrics.validation_details == {}
-
 
 class TestValidationReport:
     """Test ValidationReport data class."""
@@ -471,13 +531,13 @@ class TestValidationReport:
             recommendations=recommendations,
         )
 
-        assert len(report.file_metrics) == 3
+        assert report.file_metrics == file_metrics
         assert report.total_files == 3
         assert report.valid_files == 2
         assert report.invalid_files == 1
         assert report.is_valid is False
         assert report.summary["average_scores"]["overall"] == 71.67
-        assert len(report.recommendations) == 2
+        assert report.recommendations == recommendations
 
     def test_validation_report_all_valid(self):
         """Test ValidationReport with all valid files."""
@@ -505,13 +565,94 @@ class TestValidationReport:
         assert report.is_valid is True
         assert report.valid_files == 3
         assert report.invalid_files == 0
-        assert len(report.recommendations) == 0
+        assert report.recommendations == []
+
+    def test_validation_report_as_matrix(self):
+        """Test that scores are packed row-major as float32."""
+        file_metrics = [
+            FileValidationMetrics(
+                file_path=Path(f"test{i}.html"),
+                format_type="html",
+                file_size=1024,
+                is_valid=True,
+                content_score=80.0 + i,
+                ats_score=70.0,
+                formatting_score=60.0,
+                overall_score=72.5,
+            )
+            for i in range(2)
+        ]
+        report = ValidationReport(
+            file_metrics=file_metrics,
+            total_files=2,
+            valid_files=2,
+            invalid_files=0,
+            is_valid=True,
+        )
+
+        matrix = report.as_matrix()
+
+        assert matrix.typecode == "f"
+        assert matrix.tolist() == [80.0, 70.0, 60.0, 72.5, 81.0, 70.0, 60.0, 72.5]
+
+    @pytest.mark.parametrize(
+        "overall_scores,expected",
+        [
+            ([], (0.0, 0.0, 0.0, 0.0)),
+            ([80.0], (80.0, 0.0, 80.0, 80.0)),
+            ([60.0, 70.0, 80.0, 90.0, 100.0], (80.0, 14.142, 80.0, 98.0)),
+        ],
+        ids=["empty", "single", "spread"],
+    )
+    def test_validation_report_score_stats(self, overall_scores, expected):
+        """Test mean, std dev, median and p95 of overall scores."""
+        report = ValidationReport(
+            file_metrics=[
+                FileValidationMetrics(
+                    file_path=Path(f"test{i}.html"),
+                    format_type="html",
+                    file_size=1024,
+                    is_valid=True,
+                    overall_score=score,
+                )
+                for i, score in enumerate(overall_scores)
+            ],
+            total_files=len(overall_scores),
+            valid_files=len(overall_scores),
+            invalid_files=0,
+            is_valid=True,
+        )
+
+        assert report.score_stats() == pytest.approx(expected, abs=1e-3)
+
+    def test_validation_report_export_without_orjson(self, tmp_path, monkeypatch):
+        """Test that export falls back to the json module without orjson."""
+        monkeypatch.setitem(sys.modules, "orjson", None)
+
+        report = ValidationReport(
+            file_metrics=[
+                FileValidationMetrics(
+                    file_path=Path("résumé.html"),
+                    format_type="html",
+                    file_size=1024,
+                    is_valid=True,
+                )
+            ],
+            total_files=1,
+            valid_files=1,
+            invalid_files=0,
+            is_valid=True,
+        )
+        report_path = tmp_path / "report.json"
+
+        report.export_to_file(str(report_path))
+
+        exported_data = json.loads(report_path.read_text(encoding="utf-8"))
+        assert exported_data["file_metrics"][0]["file_path"] == "résumé.html"
+        assert exported_data["summary"]["total_files"] == 1
 
     def test_validation_report_export_to_file(self):
         """Test exporting ValidationReport to file."""
-        import json
-        import tempfile
-
         file_metrics = [
             FileValidationMetrics(
                 file_path=Path("test.html"),
@@ -552,18 +693,115 @@ class TestValidationReport:
         finally:
             Path(report_path).unlink()
 
-    def test_validation_report_default_values(self):
-        """Test default values for ValidationReport."""
+    def test_validation_report_export_ndjson(self, tmp_path):
+        """Test exporting ValidationReport as one JSON document per line."""
         report = ValidationReport(
-            file_metrics=[],
-            total_files=0,
-            valid_files=0,
+            file_metrics=[
+                FileValidationMetrics(
+                    file_path=Path(f"test{i}.html"),
+                    format_type="html",
+                    file_size=1024,
+                    is_valid=True,
+                )
+                for i in range(2)
+            ],
+            total_files=2,
+            valid_files=2,
             invalid_files=0,
             is_valid=True,
+            recommendations=["Keep up the good work"],
         )
+        report.file_metrics[1].file_path = Path("renamed.html")
+        report_path = tmp_path / "report.ndjson"
+
+        report.export_ndjson(str(report_path))
+
+        header, *lines = map(json.loads, report_path.read_text().splitlines())
+        assert header["summary"]["total_files"] == 2
+        assert header["recommendations"] == ["Keep up the good work"]
+        assert [line["file_path"] for line in lines] == ["test0.html", "renamed.html"]
+
+
+class TestDefaultValues:
+    """Test default field values across converter data classes."""
+
+    @pytest.mark.parametrize(
+        "cls,required,defaults",
+        [
+            (
+                ConversionResult,
+                {"success": True, "input_path": Path("test.md")},
+                {
+                    "output_files": [],
+                    "processing_time": 0.0,
+                    "warnings": [],
+                    "errors": [],
+                    "metadata": None,
+                },
+            ),
+            (
+                BatchConversionResult,
+                {
+                    "total_files": 5,
+                    "successful_files": 4,
+                    "failed_files": 1,
+                    "results": [],
+                    "total_processing_time": 10.0,
+                },
+                {"summary": {}},
+            ),
+            (
+                FileValidationMetrics,
+                {
+                    "file_path": Path("test.docx"),
+                    "format_type": "docx",
+                    "file_size": 2048,
+                    "is_valid": True,
+                },
+                {
+                    "content_score": 0.0,
+                    "ats_score": 0.0,
+                    "formatting_score": 0.0,
+                    "overall_score": 0.0,
+                    "issues": [],
+                    "validation_details": {},
+                },
+            ),
+            (
+                ValidationReport,
+                {
+                    "file_metrics": [],
+                    "total_files": 0,
+                    "valid_files": 0,
+                    "invalid_files": 0,
+                    "is_valid": True,
+                },
+                {"summary": {}, "recommendations": []},
+            ),
+            (
+                ConversionOptions,
+                {},
+                {
+                    "formats": ("html", "pdf", "docx"),
+                    "output_dir": None,
+                    "parallel_processing": True,
+                    "max_workers": None,
+                },
+            ),
+        ],
+        ids=[
+            "ConversionResult",
+            "BatchConversionResult",
+            "FileValidationMetrics",
+            "ValidationReport",
+            "ConversionOptions",
+        ],
+    )
+    def test_default_values(self, cls, required, defaults):
+        """Test that optional fields fall back to their declared defaults."""
+        instance = cls(**required)
 
-        assert report.summary == {}
-        assert report.recommendations == []
+        assert {name: getattr(instance, name) for name in defaults} == defaults
 
 
 class TestTypeValidation:
@@ -572,47 +810,65 @@ class TestTypeValidation:
     def test_path_type_validation(self):
         """Test that Path objects work correctly in types."""
         # Test with string paths (should be converted)
-        result = ConversionResult(
-            success=True,
-            input_path=Path("test.md"),
-            output_files=[Path("test.html"), Path("test.pdf")],
-        )
+        result = _make_result(output_files=[Path("test.html"), Path("test.pdf")])
 
-        assert isinstance(result.input_path, Path)
+        assert all(
+            isinstance(getattr(result, name), Path)
+            for name in _field_names(ConversionResult, Path)
+        )
         assert all(isinstance(f, Path) for f in result.output_files)
 
+    def test_pickle_round_trip(self):
+        """Test that results survive pickling for worker processes."""
+        batch = BatchConversionResult(total_files=1)
+        batch.add_result(_make_result(processing_time=1.5))
+        metrics = FileValidationMetrics(
+            file_path=Path("test.html"),
+            format_type="html",
+            file_size=1024,
+            is_valid=True,
+        )
+
+        restored_batch = pickle.loads(pickle.dumps(batch))
+        restored_metrics = pickle.loads(pickle.dumps(metrics))
+
+        assert restored_batch == batch
+        assert restored_batch.mean_processing_time == 1.5
+        assert restored_metrics == metrics
+        assert restored_metrics.format_type is sys.intern("html")
+
     def test_numeric_type_validation(self):
         """Test numeric type validation."""
         # Test with various numeric types
-        result = ConversionResult(
-            success=True, input_path=Path("test.md"), processing_time=2.5  # float
-        )
+        result = _make_result(processing_time=2.5)  # float
 
         assert result.processing_time == 2.5
         assert isinstance(result.processing_time, float)
 
         # Test with int (should work too)
-        result2 = ConversionResult(
-            success=True, input_path=Path("test.md"), processing_time=3  # int
-        )
+        result2 = _make_result(processing_time=3)  # int
 
         assert result2.processing_time == 3
 
     def test_list_type_validation(self):
         """Test list type validation."""
         # Test with different list types
-        result = ConversionResult(
-            success=True,
-            input_path=Path("test.md"),
-            output_files=[],  # empty list
-            warnings=["warning1", "warning2"],  # string list
-            errors=[],  # empty list
-        )
+        result = _make_result(warnings=["warning1", "warning2"])  # string list
+
+        list_fields = _field_names(ConversionResult, list)
+        assert list_fields == ("output_files", "warnings", "errors")
+        assert all(isinstance(getattr(result, name), list) for name in list_fields)
+        assert result.warnings == ["warning1", "warning2"]
 
-        assert isinstance(result.output_files, list)
-        assert isinstance(result.warnings, list)
-        assert isinstance(result.errors, list)
-        assert len(result.warnings) == 2
+    def test_mutability_smoke(self):
+        """Test that result data classes accept field updates for tracking."""
+        result = _make_result()
+        batch_result = BatchConversionResult(total_files=3)
+
+        result.success = False
+        batch_result.total_files = 5
+
+        assert (result.success, batch_result.total_files) == (False, 5)
 
     def test_optional_type_validation(self):
         """Test optional type handling."""
@@ -665,8 +921,8 @@ def sample_batch_result(sample_conversion_result):
         failed_files=1,
         results=[
             sample_conversion_result,
-            ConversionResult(success=True, input_path=Path("test2.md")),
-            ConversionResult(
+            _make_result(input_path=Path("test2.md")),
+            _make_result(
                 success=False, input_path=Path("test3.md"), errors=["Conversion failed"]
             ),
         ],
@@ -3,17 +3,30 @@ Unit tests for the utilities module.
 
 Tests utility functions including system diagnostics, format discovery,
 theme enumeration, configuration validation, and result analysis.
+
+Tests share no mutable state, so the module can be run in parallel:
+Run with pytest -n auto --dist=loadscope
 """
 
-import json
+import importlib.util
 import sys
-import tempfile
+from collections.abc import Mapping
+from functools import cache
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 import yaml
 
+try:
+    from yaml import CSafeDumper as _YDumper
+    from yaml import CSafeLoader as _YLoader
+except ImportError:
+    from yaml import SafeDumper as _YDumper
+    from yaml import SafeLoader as _YLoader
+
+from .. import utilities
 from ..types import BatchConversionResult, ConversionResult
 from ..utilities import (
     ConfigUtils,
@@ -25,14 +38,120 @@ from ..utilities import (
     validate_setup,
 )
 
+_HAS_PSUTIL = importlib.util.find_spec("psutil") is not None
+
+_EXPECTED_DEPS = frozenset(
+    {
+        "mistune",
+        "pydantic",
+        "yaml",
+        "pathlib",
+        "weasyprint",
+        "python-docx",
+        "jinja2",
+    }
+)
+
+# Keys expected in ResultUtils.analyze_conversion_result output
+_EXPECTED_TOP = frozenset({"success", "performance", "quality", "outputs"})
+_EXPECTED_PERF = frozenset({"processing_time", "files_per_second", "efficiency_rating"})
+
+_CONFIG_DICT = {
+    "version": "1.0",
+    "ats_rules": {
+        "max_line_length": 80,
+        "bullet_style": "•",
+        "optimize_keywords": True,
+    },
+    "output_formats": {
+        "enabled_formats": ["html", "pdf", "docx"],
+        "html_theme": "professional",
+    },
+    "styling": {"theme": "professional", "font_size": 11},
+    "processing": {"max_workers": 4, "validate_input": True},
+}
+
+# Serialized once at import; tests write the string instead of re-dumping
+_CANNED_CONFIG_YAML = yaml.dump(_CONFIG_DICT, Dumper=_YDumper, allow_unicode=True)
+
+_SAMPLE_CONFIG_KEYS = frozenset(
+    {"version", "ats_rules", "output_formats", "styling", "processing"}
+)
+
+# Module names SystemInfo.check_dependencies looks up while probing
+_PROBED_MODULES = (
+    "mistune",
+    "pydantic",
+    "yaml",
+    "pathlib",
+    "weasyprint",
+    "docx",
+    "jinja2",
+)
+
+# Read-only results shared by batch analysis tests
+_BATCH_RESULTS = tuple(
+    ConversionResult(
+        success=True,
+        input_path=Path(f"test_{i}.md"),
+        output_files=[Path(f"test_{i}.html")],
+        processing_time=1.0 + i * 0.5,
+        warnings=[],
+        errors=[],
+    )
+    for i in range(3)
+)
+
+
+@cache
+def _fmt_themes(format_name: str) -> tuple[str, ...]:
+    """Themes for ``format_name``, looked up once per session."""
+    return ThemeUtils.get_themes_for_format(format_name)
+
 
 class TestSystemInfo:
     """Test SystemInfo utility class."""
 
-    def test_get_system_info(self):
+    @patch("src.converter.utilities.psutil", None)
+    @patch("src.converter.utilities.platform")
+    def test_get_system_info(self, mock_platform):
         """Test getting comprehensive system information."""
-        system_info = SystemInfo.get_system_info()
+        mock_platform.uname.return_value = SimpleNamespace(
+            system="Linux",
+            release="6.0.0",
+            version="#1 SMP",
+            machine="x86_64",
+            processor="x86_64",
+        )
+        mock_platform.architecture.return_value = ("64bit", "ELF")
+        utilities._platform_details.cache_clear()
+
+        try:
+            system_info = SystemInfo.get_system_info()
+            SystemInfo.get_system_info()
+        finally:
+            utilities._platform_details.cache_clear()
+
+        assert system_info["platform"] == {
+            "system": "Linux",
+            "release": "6.0.0",
+            "version": "#1 SMP",
+            "machine": "x86_64",
+            "processor": "x86_64",
+            "architecture": "64bit",
+        }
+        assert system_info["memory"] == {"available": "psutil not available"}
+        mock_platform.uname.assert_called_once_with()
+        mock_platform.architecture.assert_called_once_with()
 
+        # Verify Python information
+        python_info = system_info["python"]
+        assert python_info["version"] == sys.version
+        assert python_info["executable"] == sys.executable
+        assert python_info["version_info"]["major"] == sys.version_info.major
+
+    def test_get_system_info_live(self, system_info):
+        """Test system information structure against the real environment."""
         assert isinstance(system_info, dict)
         assert "platform" in system_info
         assert "python" in system_info
@@ -63,23 +182,48 @@ class TestSystemInfo:
 
     def test_check_dependencies(self):
         """Test dependency checking functionality."""
-        dependencies = SystemInfo.check_dependencies()
+        probed = []
+
+        def fake_find_spec(name, *args, **kwargs):
+            probed.append(name)
+            return MagicMock()
+
+        def fake_import_module(name, *args, **kwargs):
+            # Installed, but its native libraries are missing
+            probed.append(name)
+            raise OSError("cannot load library 'libpango-1.0-0'")
+
+        utilities._probe_dependencies.cache_clear()
+        try:
+            with patch.dict(sys.modules), patch(
+                "importlib.util.find_spec", side_effect=fake_find_spec
+            ), patch("importlib.import_module", side_effect=fake_import_module):
+                for name in _PROBED_MODULES:
+                    sys.modules.pop(name, None)
+                dependencies = SystemInfo.check_dependencies()
+                SystemInfo.check_dependencies()
+        finally:
+            utilities._probe_dependencies.cache_clear()
+
+        assert dependencies == {
+            "mistune": True,
+            "pydantic": True,
+            "yaml": True,
+            "pathlib": True,
+            "weasyprint": False,
+            "python-docx": True,
+            "jinja2": True,
+        }
+        assert sorted(probed) == sorted(_PROBED_MODULES)
 
+    def test_check_dependencies_live(self, dependencies):
+        """Test dependency checking against the real environment."""
         assert isinstance(dependencies, dict)
 
         # Check expected dependencies
-        expected_deps = [
-            "mistune",
-            "pydantic",
-            "yaml",
-            "pathlib",
-            "weasyprint",
-            "python-docx",
-            "jinja2",
-        ]
-        for dep in expected_deps:
-            assert dep in dependencies
-            assert isinstance(dependencies[dep], bool)
+        missing = _EXPECTED_DEPS - dependencies.keys()
+        assert not missing
+        assert all(isinstance(v, bool) for v in dependencies.values())
 
         # Pathlib should always be available (built-in)
         assert dependencies["pathlib"] is True
@@ -88,9 +232,9 @@ class TestSystemInfo:
         assert dependencies["pydantic"] is True
         assert dependencies["yaml"] is True
 
-    def test_validate_environment(self):
+    def test_validate_environment(self, environment_issues):
         """Test environment validation."""
-        issues = SystemInfo.validate_environment()
+        issues = environment_issues
 
         assert isinstance(issues, list)
 
@@ -102,25 +246,28 @@ class TestSystemInfo:
         critical_issues = [issue for issue in issues if "critical" in issue.lower()]
         # Should have minimal critical issues in a proper environment
 
-    @patch("src.converter.utilities.psutil")
-    def test_get_memory_info_with_psutil(self, mock_psutil):
+    @pytest.mark.skipif(not _HAS_PSUTIL, reason="psutil not installed")
+    def test_get_memory_info_with_psutil(self, monkeypatch):
         """Test memory information retrieval with psutil available."""
-        # Mock psutil
-        mock_memory = MagicMock()
-        mock_memory.available = 8 * 1024**3  # 8GB
-        mock_psutil.virtual_memory.return_value = mock_memory
+        fake_psutil = SimpleNamespace(
+            virtual_memory=lambda: SimpleNamespace(available=8 * 1024**3)  # 8GB
+        )
+        monkeypatch.setattr(utilities, "psutil", fake_psutil)
 
         memory_info = SystemInfo._get_memory_info()
 
         assert "8.0 GB" in memory_info
-        mock_psutil.virtual_memory.assert_called_once()
 
-    @patch("src.converter.utilities.psutil")
-    def test_get_memory_info_without_psutil(self, mock_psutil):
+    def test_get_memory_info_without_psutil(self, monkeypatch):
         """Test memory information retrieval without psutil."""
-        # Set up mock to raise ImportError when virtual_memory is called
-        mock_psutil.virtual_memory.side_effect = ImportError("No module named 'psutil'")
-        
+
+        def virtual_memory():
+            raise ImportError("No module named 'psutil'")
+
+        monkeypatch.setattr(
+            utilities, "psutil", SimpleNamespace(virtual_memory=virtual_memory)
+        )
+
         memory_info = SystemInfo._get_memory_info()
 
         assert memory_info == "psutil not available"
@@ -133,84 +280,100 @@ class TestFormatUtils:
         """Test getting supported output formats."""
         formats = FormatUtils.get_supported_formats()
 
-        assert isinstance(formats, list)
+        assert isinstance(formats, tuple)
         assert "html" in formats
         assert "pdf" in formats
         assert "docx" in formats
         assert len(formats) >= 3
 
-    def test_validate_format(self):
+    @pytest.mark.parametrize(
+        "format_name,expected",
+        [
+            ("html", True),
+            ("HTML", True),  # Case insensitive
+            ("pdf", True),
+            ("docx", True),
+            ("txt", False),
+            ("xyz", False),
+            ("", False),
+        ],
+    )
+    def test_validate_format(self, format_name, expected):
         """Test format validation."""
-        # Valid formats
-        assert FormatUtils.validate_format("html") is True
-        assert FormatUtils.validate_format("HTML") is True  # Case insensitive
-        assert FormatUtils.validate_format("pdf") is True
-        assert FormatUtils.validate_format("docx") is True
-
-        # Invalid formats
-        assert FormatUtils.validate_format("txt") is False
-        assert FormatUtils.validate_format("xyz") is False
-        assert FormatUtils.validate_format("") is False
-
-    def test_detect_format_from_file(self):
+        assert FormatUtils.validate_format(format_name) is expected
+
+    @pytest.mark.parametrize(
+        "ext,expected",
+        [
+            ("html", "html"),
+            ("pdf", "pdf"),
+            ("docx", "docx"),
+            ("txt", None),
+        ],
+    )
+    def test_detect_format_from_file(self, format_sample_files, ext, expected):
         """Test format detection from file extension."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Create test files
-            html_file = temp_path / "test.html"
-            html_file.touch()
-
-            pdf_file = temp_path / "test.pdf"
-            pdf_file.touch()
-
-            docx_file = temp_path / "test.docx"
-            docx_file.touch()
-
-            unknown_file = temp_path / "test.txt"
-            unknown_file.touch()
-
-            # Test detection
-            assert FormatUtils.detect_format_from_file(html_file) == "html"
-            assert FormatUtils.detect_format_from_file(pdf_file) == "pdf"
-            assert FormatUtils.detect_format_from_file(docx_file) == "docx"
-            assert FormatUtils.detect_format_from_file(unknown_file) is None
+        assert FormatUtils.detect_format_from_file(format_sample_files[ext]) == expected
 
-            # Test non-existent file
-            nonexistent = temp_path / "nonexistent.html"
-            assert FormatUtils.detect_format_from_file(nonexistent) is None
+    def test_detect_format_from_nonexistent_file(self, tmp_path):
+        """Test format detection for a file that does not exist."""
+        nonexistent = tmp_path / "nonexistent.html"
+        assert FormatUtils.detect_format_from_file(nonexistent) is None
 
-    def test_get_format_info(self):
+    @pytest.mark.parametrize(
+        "suffix,expected",
+        [(".html", "html"), (".HTM", "html"), (".doc", "docx"), (".txt", None)],
+    )
+    def test_detect_format_from_suffix(self, suffix, expected):
+        """Test format detection from an extension alone."""
+        assert FormatUtils.detect_format_from_suffix(suffix) == expected
+
+    @pytest.mark.parametrize(
+        "format_name,key,expected",
+        [
+            ("html", "name", "html"),
+            ("html", "web_compatible", True),
+            ("html", "ats_friendly", False),
+            ("pdf", "name", "pdf"),
+            ("pdf", "ats_friendly", True),
+            ("pdf", "print_ready", True),
+            ("docx", "name", "docx"),
+            ("docx", "editable", True),
+            ("docx", "ats_friendly", True),
+        ],
+    )
+    def test_get_format_info(self, format_name, key, expected):
         """Test getting comprehensive format information."""
-        # Test HTML format info
-        html_info = FormatUtils.get_format_info("html")
-
-        assert isinstance(html_info, dict)
-        assert html_info["name"] == "html"
-        assert ".html" in html_info["extensions"]
-        assert ".htm" in html_info["extensions"]
-        assert "text/html" in html_info["mimetypes"]
-        assert html_info["web_compatible"] is True
-        assert html_info["ats_friendly"] is False
-
-        # Test PDF format info
-        pdf_info = FormatUtils.get_format_info("pdf")
-
-        assert pdf_info["name"] == "pdf"
-        assert ".pdf" in pdf_info["extensions"]
-        assert "application/pdf" in pdf_info["mimetypes"]
-        assert pdf_info["ats_friendly"] is True
-        assert pdf_info["print_ready"] is True
-
-        # Test DOCX format info
-        docx_info = FormatUtils.get_format_info("docx")
-
-        assert docx_info["name"] == "docx"
-        assert ".docx" in docx_info["extensions"]
-        assert docx_info["editable"] is True
-        assert docx_info["ats_friendly"] is True
-
-        # Test invalid format
+        format_info = FormatUtils.get_format_info(format_name)
+
+        assert isinstance(format_info, Mapping)
+        assert format_info[key] == expected
+
+    def test_get_format_info_cached_read_only(self):
+        """Test that format information is cached and cannot be mutated."""
+        format_info = FormatUtils.get_format_info("HTML")
+
+        assert FormatUtils.get_format_info("html") is format_info
+        with pytest.raises(TypeError):
+            format_info["name"] = "pdf"
+
+    @pytest.mark.parametrize(
+        "format_name,key,member",
+        [
+            ("html", "extensions", ".html"),
+            ("html", "extensions", ".htm"),
+            ("html", "mimetypes", "text/html"),
+            ("pdf", "extensions", ".pdf"),
+            ("pdf", "mimetypes", "application/pdf"),
+            ("docx", "extensions", ".docx"),
+        ],
+    )
+    def test_get_format_info_lists(self, format_name, key, member):
+        """Test extension and mimetype lists in format information."""
+        assert member in FormatUtils.get_format_info(format_name)[key]
+
+    def test_get_format_info_invalid(self):
+        """Test format information for an unsupported format."""
         with pytest.raises(ValueError):
             FormatUtils.get_format_info("invalid_format")
 
@@ -218,9 +381,9 @@ class TestFormatUtils:
 class TestThemeUtils:
     """Test ThemeUtils utility class."""
 
-    def test_get_available_themes(self):
+    def test_get_available_themes(self, all_themes):
         """Test getting all available themes."""
-        themes = ThemeUtils.get_available_themes()
+        themes = all_themes
 
         assert isinstance(themes, dict)
         assert "html" in themes
@@ -229,46 +392,47 @@ class TestThemeUtils:
 
         # Verify theme lists
         for format_type, theme_list in themes.items():
-            assert isinstance(theme_list, list)
+            assert isinstance(theme_list, tuple)
             assert len(theme_list) > 0
             assert "professional" in theme_list
 
     def test_get_themes_for_format(self):
         """Test getting themes for specific format."""
-        html_themes = ThemeUtils.get_themes_for_format("html")
+        html_themes = _fmt_themes("html")
 
-        assert isinstance(html_themes, list)
+        assert isinstance(html_themes, tuple)
         assert "professional" in html_themes
         assert "modern" in html_themes
         assert "minimal" in html_themes
 
         # Test case insensitivity
-        html_themes_upper = ThemeUtils.get_themes_for_format("HTML")
+        html_themes_upper = _fmt_themes("HTML")
         assert html_themes_upper == html_themes
 
         # Test non-existent format
-        unknown_themes = ThemeUtils.get_themes_for_format("unknown")
-        assert unknown_themes == []
-
-    def test_validate_theme(self):
+        unknown_themes = _fmt_themes("unknown")
+        assert unknown_themes == ()
+
+    @pytest.mark.parametrize(
+        "format_name,theme_name,expected",
+        [
+            ("html", "professional", True),
+            ("pdf", "modern", True),
+            ("docx", "minimal", True),
+            ("HTML", "Professional", True),  # Case insensitive
+            ("html", "nonexistent", False),
+            ("unknown_format", "professional", False),
+        ],
+    )
+    def test_validate_theme(self, format_name, theme_name, expected):
         """Test theme validation for formats."""
-        # Valid combinations
-        assert ThemeUtils.validate_theme("html", "professional") is True
-        assert ThemeUtils.validate_theme("pdf", "modern") is True
-        assert ThemeUtils.validate_theme("docx", "minimal") is True
-
-        # Case insensitive
-        assert ThemeUtils.validate_theme("HTML", "Professional") is True
-
-        # Invalid combinations
-        assert ThemeUtils.validate_theme("html", "nonexistent") is False
-        assert ThemeUtils.validate_theme("unknown_format", "professional") is False
+        assert ThemeUtils.validate_theme(format_name, theme_name) is expected
 
     def test_get_theme_info(self):
         """Test getting theme information."""
         professional_info = ThemeUtils.get_theme_info("professional")
 
-        assert isinstance(professional_info, dict)
+        assert isinstance(professional_info, Mapping)
         assert professional_info["name"] == "professional"
         assert "description" in professional_info
         assert "supported_formats" in professional_info
@@ -290,36 +454,21 @@ class TestThemeUtils:
 class TestConfigUtils:
     """Test ConfigUtils utility class."""
 
-    def test_validate_config_file_valid(self):
+    def test_validate_config_file_valid(self, tmp_path):
         """Test validation of valid configuration file."""
-        valid_config = {
-            "version": "1.0",
-            "ats_rules": {"max_line_length": 80, "bullet_style": "•"},
-            "output_formats": {
-                "enabled_formats": ["html", "pdf"],
-                "html_theme": "professional",
-            },
-            "styling": {"theme": "professional", "font_size": 11},
-            "processing": {"max_workers": 4, "validate_input": True},
-        }
+        config_path = tmp_path / "config.yaml"
+        config_path.write_text(_CANNED_CONFIG_YAML, encoding="utf-8")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(valid_config, f)
-            config_path = f.name
+        result = ConfigUtils.validate_config_file(config_path)
 
-        try:
-            result = ConfigUtils.validate_config_file(config_path)
-
-            assert result["is_valid"] is True
-            assert result["file_exists"] is True
-            assert result["file_readable"] is True
-            assert result["yaml_valid"] is True
-            assert result["schema_valid"] is True
-            assert result["business_rules_valid"] is True
-            assert len(result["errors"]) == 0
-            assert "config_summary" in result
-        finally:
-            Path(config_path).unlink()
+        assert result["is_valid"] is True
+        assert result["file_exists"] is True
+        assert result["file_readable"] is True
+        assert result["yaml_valid"] is True
+        assert result["schema_valid"] is True
+        assert result["business_rules_valid"] is True
+        assert len(result["errors"]) == 0
+        assert "config_summary" in result
 
     def test_validate_config_file_nonexistent(self):
         """Test validation of non-existent configuration file."""
@@ -330,114 +479,95 @@ class TestConfigUtils:
         assert len(result["errors"]) > 0
         assert "does not exist" in result["errors"][0]
 
-    def test_validate_config_file_invalid_yaml(self):
+    def test_validate_config_file_invalid_yaml(self, tmp_path):
         """Test validation of invalid YAML file."""
         invalid_yaml = "invalid: yaml: content: ["
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            f.write(invalid_yaml)
-            config_path = f.name
+        config_path = tmp_path / "invalid.yaml"
+        config_path.write_text(invalid_yaml, encoding="utf-8")
 
-        try:
-            result = ConfigUtils.validate_config_file(config_path)
-
-            assert result["is_valid"] is False
-            assert result["file_exists"] is True
-            assert result["file_readable"] is True
-            assert result["yaml_valid"] is False
-            assert len(result["errors"]) > 0
-            assert "yaml" in result["errors"][0].lower()
-        finally:
-            Path(config_path).unlink()
+        result = ConfigUtils.validate_config_file(config_path)
+
+        assert result["is_valid"] is False
+        assert result["file_exists"] is True
+        assert result["file_readable"] is True
+        assert result["yaml_valid"] is False
+        assert len(result["errors"]) > 0
+        assert "yaml" in result["errors"][0].lower()
 
-    def test_create_sample_config(self):
+    def test_create_sample_config(self, tmp_path):
         """Test creation of sample configuration file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            sample_path = f.name
+        sample_path = tmp_path / "sample.yaml"
 
-        try:
-            ConfigUtils.create_sample_config(sample_path)
+        ConfigUtils.create_sample_config(sample_path)
 
-            # Verify file was created
-            assert Path(sample_path).exists()
+        # Verify file was created
+        assert sample_path.exists()
 
-            # Verify content
-            with open(sample_path) as f:
-                sample_config = yaml.safe_load(f)
+        # Verify content
+        with open(sample_path, encoding="utf-8") as f:
+            sample_config = yaml.load(f, Loader=_YLoader)
 
-            assert "version" in sample_config
-            assert "ats_rules" in sample_config
-            assert "output_formats" in sample_config
-            assert "styling" in sample_config
-            assert "processing" in sample_config
+        assert _SAMPLE_CONFIG_KEYS <= sample_config.keys()
 
-            # Verify specific values
-            assert sample_config["ats_rules"]["max_line_length"] == 80
-            assert "html" in sample_config["output_formats"]["enabled_formats"]
-        finally:
-            Path(sample_path).unlink()
+        # Verify specific values
+        assert sample_config["ats_rules"]["max_line_length"] == 80
+        assert "html" in sample_config["output_formats"]["enabled_formats"]
+        assert isinstance(sample_config["created_at"], str)
 
 
 class TestResultUtils:
     """Test ResultUtils utility class."""
 
-    def test_analyze_conversion_result(self):
+    def test_analyze_conversion_result(self, make_result):
         """Test analysis of single conversion result."""
-        result = ConversionResult(
-            success=True,
-            input_path=Path("test.md"),
-            output_files=[Path("test.html"), Path("test.pdf")],
-            processing_time=2.5,
-            warnings=["Minor formatting issue"],
-            errors=[],
-        )
+        result = make_result(True, 2, 2.5, 1, 0)
 
         analysis = ResultUtils.analyze_conversion_result(result)
 
         assert isinstance(analysis, dict)
-        assert "success" in analysis
-        assert "performance" in analysis
-        assert "quality" in analysis
-        assert "outputs" in analysis
+        assert _EXPECTED_TOP <= analysis.keys()
 
         # Verify performance metrics
         performance = analysis["performance"]
+        assert _EXPECTED_PERF <= performance.keys()
         assert performance["processing_time"] == 2.5
         assert performance["files_per_second"] == pytest.approx(0.4, rel=1e-1)
-        assert "efficiency_rating" in performance
 
         # Verify quality metrics
         quality = analysis["quality"]
-        assert quality["output_count"] == 2
-        assert quality["warning_count"] == 1
-        assert quality["error_count"] == 0
         assert "quality_score" in quality
+        expected_counts = {"output_count": 2, "warning_count": 1, "error_count": 0}
+        assert expected_counts.items() <= quality.items()
 
         # Verify outputs
         outputs = analysis["outputs"]
         assert len(outputs) == 2
-        assert all("path" in output for output in outputs)
-        assert all("format" in output for output in outputs)
+        assert all({"path", "format"} <= output.keys() for output in outputs)
 
-    def test_analyze_batch_result(self):
-        """Test analysis of batch conversion result."""
-        individual_results = [
-            ConversionResult(
-                success=True,
-                input_path=Path(f"test_{i}.md"),
-                output_files=[Path(f"test_{i}.html")],
-                processing_time=1.0 + i * 0.5,
-                warnings=[],
-                errors=[],
-            )
-            for i in range(3)
+    def test_analyze_conversion_result_outputs(self, tmp_path):
+        """Test that output entries reflect what exists on disk."""
+        written = tmp_path / "resume.html"
+        written.write_text("<html></html>")
+        missing = tmp_path / "resume.pdf"
+        result = ConversionResult(
+            success=True, input_path=Path("resume.md"), output_files=[written, missing]
+        )
+
+        outputs = ResultUtils.analyze_conversion_result(result)["outputs"]
+
+        assert outputs == [
+            {"path": str(written), "format": "html", "size": 13, "exists": True},
+            {"path": str(missing), "format": None, "size": 0, "exists": False},
         ]
 
+    def test_analyze_batch_result(self):
+        """Test analysis of batch conversion result."""
         batch_result = BatchConversionResult(
             total_files=3,
             successful_files=3,
             failed_files=0,
-            results=individual_results,
+            results=list(_BATCH_RESULTS),
             total_processing_time=4.5,
             summary={"success_rate": 100.0},
         )
@@ -467,125 +597,118 @@ class TestResultUtils:
         individual_analyses = analysis["individual_results"]
         assert len(individual_analyses) == 3
 
-    def test_export_results_to_json(self):
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_export_results_to_json(self, make_result, monkeypatch, use_orjson):
         """Test exporting results to JSON file."""
-        result = ConversionResult(
-            success=True,
-            input_path=Path("test.md"),
-            output_files=[Path("test.html")],
-            processing_time=1.5,
-            warnings=[],
-            errors=[],
-        )
+        try:
+            from orjson import loads
+        except ImportError:
+            from json import loads
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            output_path = f.name
+        if not use_orjson:
+            monkeypatch.setattr(utilities, "orjson", None)
+        elif utilities.orjson is None:
+            pytest.skip("orjson not installed")
 
-        try:
+        result = make_result(True, 1, 1.5, 0, 0)
+
+        with patch("src.converter.utilities.open", mock_open(), create=True) as m:
             ResultUtils.export_results_to_json(
-                result, output_path, include_analysis=True
+                result, "out.json", include_analysis=True
             )
 
-            # Verify file was created
-            assert Path(output_path).exists()
-
-            # Verify content
-            with open(output_path) as f:
-                exported_data = json.load(f)
-
-            assert "type" in exported_data
-            assert "timestamp" in exported_data
-            assert "success" in exported_data
-            assert "analysis" in exported_data
+        # Verify the file was opened for writing
+        if use_orjson:
+            m.assert_called_once_with(Path("out.json"), "wb")
+        else:
+            m.assert_called_once_with(Path("out.json"), "w", encoding="utf-8")
+
+        # Verify content
+        empty = b"" if use_orjson else ""
+        written = empty.join(c.args[0] for c in m().write.call_args_list)
+        exported_data = loads(written)
+
+        assert "type" in exported_data
+        assert "timestamp" in exported_data
+        assert "success" in exported_data
+        assert "analysis" in exported_data
+
+        assert exported_data["type"] == "single_result"
+        assert exported_data["success"] is True
+        assert exported_data["metadata"] == {}
+
+    @pytest.mark.parametrize("use_orjson", [True, False], ids=["orjson", "json"])
+    def test_export_results_to_json_non_serializable_metadata(
+        self, monkeypatch, use_orjson
+    ):
+        """Test metadata values JSON cannot encode are exported as strings."""
+        try:
+            from orjson import loads
+        except ImportError:
+            from json import loads
 
-            assert exported_data["type"] == "single_result"
-            assert exported_data["success"] is True
-        finally:
-            Path(output_path).unlink()
+        if not use_orjson:
+            monkeypatch.setattr(utilities, "orjson", None)
+        elif utilities.orjson is None:
+            pytest.skip("orjson not installed")
 
-    def test_calculate_efficiency_rating(self):
-        """Test efficiency rating calculation."""
-        # Excellent performance
-        fast_result = ConversionResult(
+        result = ConversionResult(
             success=True,
             input_path=Path("test.md"),
-            output_files=[],
-            processing_time=1.0,
+            metadata={"source": Path("resumes/test.md")},
         )
-        assert ResultUtils._calculate_efficiency_rating(fast_result) == "excellent"
 
-        # Good performance
-        good_result = ConversionResult(
-            success=True,
-            input_path=Path("test.md"),
-            output_files=[],
-            processing_time=3.0,
-        )
-        assert ResultUtils._calculate_efficiency_rating(good_result) == "good"
+        with patch("src.converter.utilities.open", mock_open(), create=True) as m:
+            ResultUtils.export_results_to_json(result, "out.json")
 
-        # Fair performance
-        fair_result = ConversionResult(
-            success=True,
-            input_path=Path("test.md"),
-            output_files=[],
-            processing_time=7.0,
-        )
-        assert ResultUtils._calculate_efficiency_rating(fair_result) == "fair"
+        empty = b"" if use_orjson else ""
+        written = empty.join(c.args[0] for c in m().write.call_args_list)
 
-        # Poor performance
-        slow_result = ConversionResult(
-            success=True,
-            input_path=Path("test.md"),
-            output_files=[],
-            processing_time=15.0,
-        )
-        assert ResultUtils._calculate_efficiency_rating(slow_result) == "poor"
+        assert loads(written)["metadata"] == {
+            "source": str(Path("resumes/test.md"))
+        }
 
-    def test_calculate_quality_score(self):
+    @pytest.mark.parametrize(
+        "processing_time,rating",
+        [
+            (1.0, "excellent"),
+            (2.0, "good"),
+            (3.0, "good"),
+            (7.0, "fair"),
+            (10.0, "poor"),
+            (15.0, "poor"),
+        ],
+    )
+    def test_calculate_efficiency_rating(self, make_result, processing_time, rating):
+        """Test efficiency rating calculation."""
+        result = make_result(True, 0, processing_time, 0, 0)
+        assert ResultUtils._calculate_efficiency_rating(result) == rating
+
+    @pytest.mark.parametrize(
+        "success,n_outputs,n_warnings,n_errors,expected",
+        [
+            # Perfect result: bonus for multiple outputs
+            (True, 2, 0, 0, 104.0),
+            # Result with warnings: 100 - (2 * 5)
+            (True, 1, 2, 0, 90.0),
+            # Result with errors: 100 - (1 * 20)
+            (False, 0, 0, 1, 80.0),
+        ],
+    )
+    def test_calculate_quality_score(
+        self, make_result, success, n_outputs, n_warnings, n_errors, expected
+    ):
         """Test quality score calculation."""
-        # Perfect result
-        perfect_result = ConversionResult(
-            success=True,
-            input_path=Path("test.md"),
-            output_files=[Path("test.html"), Path("test.pdf")],
-            processing_time=1.0,
-            warnings=[],
-            errors=[],
-        )
-        perfect_score = ResultUtils._calculate_quality_score(perfect_result)
-        assert perfect_score > 100  # Bonus for multiple outputs
-
-        # Result with warnings
-        warning_result = ConversionResult(
-            success=True,
-            input_path=Path("test.md"),
-            output_files=[Path("test.html")],
-            processing_time=1.0,
-            warnings=["Warning 1", "Warning 2"],
-            errors=[],
-        )
-        warning_score = ResultUtils._calculate_quality_score(warning_result)
-        assert warning_score == 90.0  # 100 - (2 * 5)
-
-        # Result with errors
-        error_result = ConversionResult(
-            success=False,
-            input_path=Path("test.md"),
-            output_files=[],
-            processing_time=1.0,
-            warnings=[],
-            errors=["Error 1"],
-        )
-        error_score = ResultUtils._calculate_quality_score(error_result)
-        assert error_score == 80.0  # 100 - (1 * 20)
+        result = make_result(success, n_outputs, 1.0, n_warnings, n_errors)
+        assert ResultUtils._calculate_quality_score(result) == expected
 
 
 class TestConvenienceFunctions:
     """Test convenience functions."""
 
-    def test_get_system_diagnostics(self):
+    def test_get_system_diagnostics(self, system_diagnostics):
         """Test comprehensive system diagnostics function."""
-        diagnostics = get_system_diagnostics()
+        diagnostics = system_diagnostics
 
         assert isinstance(diagnostics, dict)
         assert "system_info" in diagnostics
@@ -604,15 +727,18 @@ class TestConvenienceFunctions:
         themes = diagnostics["available_themes"]
         assert "html" in themes
         assert "pdf" in themes
-        assert isinstance(themes["html"], list)
+        assert isinstance(themes["html"], tuple)
 
-    def test_validate_setup(self):
+    def test_validate_setup(self, setup_result, environment_issues):
         """Test setup validation function."""
-        is_valid, issues = validate_setup()
+        is_valid, issues = setup_result
 
         assert isinstance(is_valid, bool)
         assert isinstance(issues, list)
 
+        # Setup validation reports the environment issues unchanged
+        assert issues == environment_issues
+
         # In a properly configured environment, should be mostly valid
         if not is_valid:
             # Issues should be descriptive
@@ -624,6 +750,75 @@ class TestConvenienceFunctions:
 
 
 @pytest.fixture
+def make_result():
+    """Factory returning a new ConversionResult on every call."""
+
+    def _make_result(
+        success: bool,
+        n_outputs: int,
+        processing_time: float,
+        n_warnings: int,
+        n_errors: int,
+    ) -> ConversionResult:
+        return ConversionResult(
+            success=success,
+            input_path=Path("test.md"),
+            output_files=[Path(f"test{i}.html") for i in range(n_outputs)],
+            processing_time=processing_time,
+            warnings=["warning"] * n_warnings,
+            errors=["error"] * n_errors,
+        )
+
+    return _make_result
+
+
+@pytest.fixture(scope="session")
+def system_info():
+    """System information, collected once per session."""
+    return SystemInfo.get_system_info()
+
+
+@pytest.fixture(scope="session")
+def dependencies():
+    """Dependency availability map, probed once per session."""
+    return SystemInfo.check_dependencies()
+
+
+@pytest.fixture(scope="session")
+def environment_issues():
+    """Environment validation issues, computed once per session."""
+    return SystemInfo.validate_environment()
+
+
+@pytest.fixture(scope="session")
+def setup_result():
+    """Setup validation result, computed once per session."""
+    return validate_setup()
+
+
+@pytest.fixture(scope="session")
+def all_themes():
+    """Available themes by format, enumerated once per session."""
+    return ThemeUtils.get_available_themes()
+
+
+@pytest.fixture(scope="session")
+def system_diagnostics():
+    """Full system diagnostics, computed once per session."""
+    return get_system_diagnostics()
+
+
+@pytest.fixture(scope="session")
+def format_sample_files(tmp_path_factory):
+    """Empty sample files keyed by extension, created once per session."""
+    sample_dir = tmp_path_factory.mktemp("formats")
+    files = {ext: sample_dir / f"test.{ext}" for ext in ("html", "pdf", "docx", "txt")}
+    for file_path in files.values():
+        file_path.touch()
+    return files
+
+
+@pytest.fixture(scope="module")
 def sample_conversion_result():
     """Sample conversion result for testing."""
     return ConversionResult(
@@ -641,7 +836,7 @@ def sample_conversion_result():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_batch_result(sample_conversion_result):
     """Sample batch result for testing."""
     results = [sample_conversion_result] * 3
@@ -655,26 +850,10 @@ def sample_batch_result(sample_conversion_result):
     )
 
 
-@pytest.fixture
-def temp_config_file(tmp_path):
+@pytest.fixture(scope="module")
+def temp_config_file(tmp_path_factory):
     """Create a temporary configuration file for testing."""
-    config_content = {
-        "version": "1.0",
-        "ats_rules": {
-            "max_line_length": 80,
-            "bullet_style": "•",
-            "optimize_keywords": True,
-        },
-        "output_formats": {
-            "enabled_formats": ["html", "pdf", "docx"],
-            "html_theme": "professional",
-        },
-        "styling": {"theme": "professional", "font_size": 11},
-        "processing": {"max_workers": 4, "validate_input": True},
-    }
-
-    config_file = tmp_path / "test_config.yaml"
-    with open(config_file, "w") as f:
-        yaml.dump(config_content, f)
+    config_file = tmp_path_factory.mktemp("config") / "test_config.yaml"
+    config_file.write_text(_CANNED_CONFIG_YAML, encoding="utf-8")
 
     return config_file
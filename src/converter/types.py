@@ -5,14 +5,22 @@ This module defines the fundamental data structures, protocols, and exceptions
 used throughout the converter pipeline.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime
+import sys
+import time
+from array import array
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, fields
 from enum import Enum
+from math import fsum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Protocol
 
+# Shared read-only stand-in for results that never recorded metadata
+_EMPTY_METADATA: Mapping[str, Any] = MappingProxyType({})
 
-@dataclass
+
+@dataclass(slots=True)
 class ConversionResult:
     """
     Result of a single resume conversion operation.
@@ -24,7 +32,8 @@ class ConversionResult:
         processing_time: Time taken for conversion in seconds
         warnings: List of warning messages
         errors: List of error messages
-        metadata: Additional metadata about the conversion
+        metadata: Additional metadata about the conversion, or None until
+            the first set_metadata() call
     """
 
     success: bool
@@ -33,23 +42,50 @@ class ConversionResult:
     processing_time: float = 0.0
     warnings: list[str] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] | None = None
 
     @property
     def output_count(self) -> int:
         """Number of output files generated."""
         return len(self.output_files)
 
+    @property
+    def metadata_or_empty(self) -> Mapping[str, Any]:
+        """Metadata for reading, without allocating a dict when unset."""
+        return self.metadata or _EMPTY_METADATA
+
+    def set_metadata(self, key: str, value: Any) -> None:
+        """Set a metadata entry, allocating the dict on first use."""
+        if self.metadata is None:
+            self.metadata = {}
+        self.metadata[key] = value
+
     def add_error(self, error_message: str) -> None:
-        """Add an error message to the result."""
+        """Add an error message to the result and mark it as failed."""
         self.errors.append(error_message)
+        self.success = False
 
     def add_warning(self, warning_message: str) -> None:
         """Add a warning message to the result."""
         self.warnings.append(warning_message)
 
-
-@dataclass
+    def __reduce__(self) -> tuple:
+        # Positional constructor args pickle smaller than the slot state
+        return (
+            self.__class__,
+            (
+                self.success,
+                self.input_path,
+                self.output_files,
+                self.processing_time,
+                self.warnings,
+                self.errors,
+                self.metadata,
+            ),
+        )
+
+
+@dataclass(slots=True)
 class BatchConversionResult:
     """
     Result of a batch resume conversion operation.
@@ -77,6 +113,43 @@ class BatchConversionResult:
             return 0.0
         return (self.successful_files / self.total_files) * 100
 
+    @property
+    def mean_processing_time(self) -> float:
+        """Mean per-file processing time in seconds."""
+        # Computed from results on demand, so results appended directly
+        # rather than through add_result() are included
+        results = self.results
+        if not results:
+            return 0.0
+        return fsum(r.processing_time for r in results) / len(results)
+
+    def add_result(self, result: ConversionResult) -> None:
+        """
+        Record an individual conversion result in the batch.
+
+        Updates the success/failure counters; total_processing_time is left
+        to the caller since it measures wall time for the whole batch.
+        """
+        self.results.append(result)
+        if result.success:
+            self.successful_files += 1
+        else:
+            self.failed_files += 1
+
+    def __reduce__(self) -> tuple:
+        # Positional constructor args pickle smaller than the slot state
+        return (
+            self.__class__,
+            (
+                self.total_files,
+                self.successful_files,
+                self.failed_files,
+                self.results,
+                self.total_processing_time,
+                self.summary,
+            ),
+        )
+
 
 class ProgressCallback(Protocol):
     """
@@ -105,26 +178,88 @@ class ProgressCallback(Protocol):
         ...
 
 
-@dataclass
+_DEFAULT_FORMATS: tuple[str, ...] = ("html", "pdf", "docx")
+
+
+@dataclass(slots=True)
+class ProgressReporter:
+    """
+    Throttled dispatcher for a progress callback.
+
+    Updates for the same stage that arrive within ``min_interval_ns`` of the
+    last delivered update are dropped, so progress can be reported from tight
+    loops at constant cost. Stage changes and completion (100%) are always
+    delivered.
+
+    Attributes:
+        callback: Callback receiving delivered updates, or None to discard them
+        min_interval_ns: Minimum time between delivered updates, in nanoseconds
+    """
+
+    callback: ProgressCallback | None
+    min_interval_ns: int = 50_000_000
+    _last_ns: int = field(default=0, init=False, repr=False, compare=False)
+    _last_stage: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def report(
+        self,
+        stage: str,
+        progress: float,
+        message: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Forward a progress update unless it falls inside the throttle window.
+
+        Args:
+            stage: Current processing stage
+            progress: Progress as percentage (0.0 to 100.0)
+            message: Human-readable progress message
+            metadata: Optional additional metadata
+        """
+        callback = self.callback
+        if callback is None:
+            return
+
+        now = time.monotonic_ns()
+        if (
+            progress < 100.0
+            and stage == self._last_stage
+            and now - self._last_ns < self.min_interval_ns
+        ):
+            return
+
+        self._last_ns = now
+        self._last_stage = stage
+        callback(stage, progress, message, metadata)
+
+
+@dataclass(slots=True)
 class ConversionOptions:
     """
     Options for customizing conversion behavior.
 
     Attributes:
-        formats: List of output formats to generate
+        formats: Output formats to generate
         output_dir: Output directory for generated files
         filename_prefix: Custom prefix for output files
         overwrite_existing: Whether to overwrite existing files
         validate_output: Whether to validate generated outputs
         parallel_processing: Whether to use parallel processing for batch
+        max_workers: Worker process count for batches (None uses all CPUs)
     """
 
-    formats: list[str] = field(default_factory=lambda: ["html", "pdf", "docx"])
+    formats: tuple[str, ...] = _DEFAULT_FORMATS
     output_dir: Path | None = None
     filename_prefix: str | None = None
     overwrite_existing: bool = True
     validate_output: bool = True
     parallel_processing: bool = True
+    max_workers: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.formats is not _DEFAULT_FORMATS:
+            self.formats = tuple(map(sys.intern, self.formats))
 
 
 class ProcessingStage(Enum):
@@ -142,7 +277,7 @@ class ProcessingStage(Enum):
     COMPLETE = "complete"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingStageInfo:
     """
     Represents a processing stage with metadata.
@@ -158,7 +293,7 @@ class ProcessingStageInfo:
     weight: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class FileValidationMetrics:
     """
     Validation metrics for a single file.
@@ -187,8 +322,33 @@ class FileValidationMetrics:
     issues: list[str] = field(default_factory=list)
     validation_details: dict[str, Any] = field(default_factory=dict)
 
-
-@dataclass
+    def __post_init__(self) -> None:
+        # Only a handful of distinct formats exist; share one string object each
+        self.format_type = sys.intern(self.format_type)
+
+    def __reduce__(self) -> tuple:
+        return (
+            self.__class__,
+            (
+                self.file_path,
+                self.format_type,
+                self.file_size,
+                self.is_valid,
+                self.content_score,
+                self.ats_score,
+                self.formatting_score,
+                self.overall_score,
+                self.issues,
+                self.validation_details,
+            ),
+        )
+
+
+# Field names exported per file, resolved once instead of per report
+_FILE_METRICS_FIELDS = tuple(f.name for f in fields(FileValidationMetrics))
+
+
+@dataclass(slots=True)
 class ValidationReport:
     """
     Comprehensive validation report for multiple files.
@@ -211,37 +371,131 @@ class ValidationReport:
     summary: dict[str, Any] = field(default_factory=dict)
     recommendations: list[str] = field(default_factory=list)
 
+    def as_matrix(self) -> array:
+        """
+        Pack per-file scores into a contiguous float32 row-major matrix.
+
+        Each file contributes one row of four columns: content, ats,
+        formatting and overall score, so row i starts at index 4 * i.
+
+        Returns:
+            array('f') of length 4 * len(file_metrics)
+        """
+        matrix = array("f")
+        for metrics in self.file_metrics:
+            matrix.extend(
+                (
+                    metrics.content_score,
+                    metrics.ats_score,
+                    metrics.formatting_score,
+                    metrics.overall_score,
+                )
+            )
+        return matrix
+
+    def score_stats(self) -> tuple[float, float, float, float]:
+        """
+        Summarise overall scores across all files.
+
+        Returns:
+            Tuple of (mean, population std dev, median, 95th percentile);
+            all zeros for an empty report
+        """
+        from statistics import fmean, pstdev, quantiles
+
+        scores = self.as_matrix()[3::4]
+        if not scores:
+            return (0.0, 0.0, 0.0, 0.0)
+        if len(scores) == 1:
+            return (scores[0], 0.0, scores[0], scores[0])
+
+        cuts = quantiles(scores, n=20, method="inclusive")
+        return (fmean(scores), pstdev(scores), cuts[9], cuts[18])
+
     def export_to_file(self, file_path: str) -> None:
-        """Export validation report to JSON file."""
-        import json
+        """
+        Export validation report to JSON file.
 
-        # Convert dataclasses to dict for JSON serialization
-        report_data = {
-            "summary": {
-                "total_files": self.total_files,
-                "valid_files": self.valid_files,
-                "invalid_files": self.invalid_files,
-                "is_valid": self.is_valid,
-                **self.summary,
-            },
-            "file_metrics": [
-                {
-                    "file_path": str(metrics.file_path),
-                    "format_type": metrics.format_type,
-                    "file_size": metrics.file_size,
-                    "is_valid": metrics.is_valid,
-                    "content_score": metrics.content_score,
-                    "ats_score": metrics.ats_score,
-                    "formatting_score": metrics.formatting_score,
-                    "overall_score": metrics.overall_score,
-                    "issues": metrics.issues,
-                    "validation_details": metrics.validation_details,
-                }
-                for metrics in self.file_metrics
-            ],
+        The document is streamed one section and one file entry at a time,
+        so the whole report is never held in memory as a single dict. Uses
+        orjson when it is installed and falls back to the standard library
+        json module otherwise; both produce the same document.
+        """
+        from datetime import datetime
+
+        dumps = _json_dumps()
+
+        with open(file_path, "wb", buffering=1 << 20) as f:
+            f.write(b'{"summary":')
+            f.write(dumps(self._summary_dict()))
+            f.write(b',"file_metrics":[')
+            for index, metrics in enumerate(self.file_metrics):
+                if index:
+                    f.write(b",")
+                f.write(dumps(_metrics_dict(metrics)))
+            f.write(b'],"recommendations":')
+            f.write(dumps(self.recommendations))
+            f.write(b',"generated_at":')
+            f.write(dumps(datetime.now().isoformat()))
+            f.write(b"}")
+
+    def export_ndjson(self, file_path: str) -> None:
+        """
+        Export validation report as newline-delimited JSON.
+
+        The first line holds the summary, recommendations and timestamp;
+        each following line is one file's metrics. Prefer this over
+        export_to_file for large reports, since consumers can parse it
+        line by line instead of loading the whole document.
+        """
+        from datetime import datetime
+
+        dumps = _json_dumps()
+        header = {
+            "summary": self._summary_dict(),
             "recommendations": self.recommendations,
             "generated_at": datetime.now().isoformat(),
         }
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(report_data, f, indent=2, ensure_ascii=False)
+        with open(file_path, "wb", buffering=1 << 20) as f:
+            f.write(dumps(header) + b"\n")
+            for metrics in self.file_metrics:
+                f.write(dumps(_metrics_dict(metrics)) + b"\n")
+
+    def _summary_dict(self) -> dict[str, Any]:
+        """Build the summary section shared by both export formats."""
+        return {
+            "total_files": self.total_files,
+            "valid_files": self.valid_files,
+            "invalid_files": self.invalid_files,
+            "is_valid": self.is_valid,
+            **self.summary,
+        }
+
+
+def _metrics_dict(metrics: FileValidationMetrics) -> dict[str, Any]:
+    """Build the exported form of one file's metrics."""
+    exported = {name: getattr(metrics, name) for name in _FILE_METRICS_FIELDS}
+    exported["file_path"] = str(metrics.file_path)
+    return exported
+
+
+def _json_dumps() -> Callable[[Any], bytes]:
+    """Return a compact UTF-8 JSON encoder, preferring orjson when installed."""
+    try:
+        import orjson
+    except ImportError:
+        orjson = None
+
+    if orjson is not None:
+
+        def dumps(obj: Any) -> bytes:
+            return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    else:
+        import json
+
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")
+
+    return dumps
@@ -5,28 +5,106 @@ This module provides various utility functions for format discovery, theme enume
 template validation, configuration validation, and system diagnostics.
 """
 
+import importlib
+import importlib.util
 import json
 import logging
+import os
 import platform
 import sys
+from bisect import bisect_right
+from collections.abc import Mapping
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-import yaml
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 try:
     import psutil
 except ImportError:
     psutil = None
 
-from src.config import Config, ConfigValidator
+if TYPE_CHECKING:
+    from src.config import Config
 
 from .exceptions import ConfigurationError, ValidationError
 from .types import BatchConversionResult, ConversionResult
 
 logger = logging.getLogger(__name__)
 
+# Processing-time upper bounds (seconds, exclusive) for each efficiency rating
+_EFFICIENCY_THRESHOLDS = (2.0, 5.0, 10.0)
+_EFFICIENCY_LABELS = ("excellent", "good", "fair", "poor")
+
+
+# (display name, import name) for each dependency reported by check_dependencies
+_DEPENDENCY_MODULES = (
+    ("mistune", "mistune"),
+    ("pydantic", "pydantic"),
+    ("yaml", "yaml"),
+    ("pathlib", "pathlib"),
+    ("weasyprint", "weasyprint"),
+    ("python-docx", "docx"),
+    ("jinja2", "jinja2"),
+)
+
+# Dependencies that can be installed yet fail to import (weasyprint loads
+# pango/cairo at import time), so they are checked with a real import
+_IMPORT_PROBED_MODULES = frozenset({"weasyprint"})
+
+
+def _module_available(module: str) -> bool:
+    """Report whether ``module`` can be imported."""
+    if module in sys.modules:
+        return True
+    if module in _IMPORT_PROBED_MODULES:
+        try:
+            importlib.import_module(module)
+        except (ImportError, OSError):
+            return False
+        return True
+    return importlib.util.find_spec(module) is not None
+
+
+@lru_cache(maxsize=1)
+def _probe_dependencies() -> tuple[tuple[str, bool], ...]:
+    """
+    Probe each dependency once per process.
+
+    Most modules not yet loaded are located with find_spec, which consults
+    the import finders without executing the module or raising on a miss;
+    those in _IMPORT_PROBED_MODULES are imported to confirm they load.
+    """
+    return tuple(
+        (name, _module_available(module)) for name, module in _DEPENDENCY_MODULES
+    )
+
+
+@lru_cache(maxsize=1)
+def _platform_details() -> tuple[tuple[str, str], ...]:
+    """
+    Collect the uname-backed platform fields once per process.
+
+    platform.uname() can shell out (``ver`` on Windows) and
+    platform.architecture() runs ``file`` on the interpreter, so only the
+    first caller pays for them.
+    """
+    uname = platform.uname()
+    return (
+        ("system", uname.system),
+        ("release", uname.release),
+        ("version", uname.version),
+        ("machine", uname.machine),
+        ("processor", uname.processor),
+        ("architecture", platform.architecture()[0]),
+    )
+
 
 class SystemInfo:
     """System information and diagnostics utilities."""
@@ -36,18 +114,14 @@ class SystemInfo:
         """
         Get comprehensive system information.
 
+        The platform fields are computed on the first call and reused for the
+        process lifetime.
+
         Returns:
             Dictionary with system information
         """
         return {
-            "platform": {
-                "system": platform.system(),
-                "release": platform.release(),
-                "version": platform.version(),
-                "machine": platform.machine(),
-                "processor": platform.processor(),
-                "architecture": platform.architecture()[0],
-            },
+            "platform": dict(_platform_details()),
             "python": {
                 "version": sys.version,
                 "version_info": {
@@ -85,32 +159,13 @@ class SystemInfo:
         """
         Check if all required dependencies are available.
 
+        Availability is probed once per process; later calls return a copy
+        of the cached answer.
+
         Returns:
             Dictionary mapping dependency names to availability
         """
-        dependencies = {
-            "mistune": False,
-            "pydantic": False,
-            "yaml": False,
-            "pathlib": False,
-            "weasyprint": False,
-            "python-docx": False,
-            "jinja2": False,
-        }
-
-        for dep in dependencies:
-            try:
-                if dep == "python-docx":
-                    import docx
-                elif dep == "yaml":
-                    import yaml
-                else:
-                    __import__(dep)
-                dependencies[dep] = True
-            except ImportError:
-                dependencies[dep] = False
-
-        return dependencies
+        return dict(_probe_dependencies())
 
     @staticmethod
     def validate_environment() -> list[str]:
@@ -150,7 +205,7 @@ class SystemInfo:
 class FormatUtils:
     """Utilities for format discovery and validation."""
 
-    SUPPORTED_FORMATS = ["html", "pdf", "docx"]
+    SUPPORTED_FORMATS = ("html", "pdf", "docx")
 
     FORMAT_EXTENSIONS = {
         "html": [".html", ".htm"],
@@ -167,10 +222,17 @@ class FormatUtils:
         ],
     }
 
+    # Flat reverse index of FORMAT_EXTENSIONS for single-lookup detection
+    _EXT_TO_FORMAT = {
+        ext: format_name
+        for format_name, extensions in FORMAT_EXTENSIONS.items()
+        for ext in extensions
+    }
+
     @staticmethod
-    def get_supported_formats() -> list[str]:
-        """Get list of supported output formats."""
-        return FormatUtils.SUPPORTED_FORMATS.copy()
+    def get_supported_formats() -> tuple[str, ...]:
+        """Get the supported output formats."""
+        return FormatUtils.SUPPORTED_FORMATS
 
     @staticmethod
     def validate_format(format_name: str) -> bool:
@@ -199,50 +261,74 @@ class FormatUtils:
         if not file_path.exists():
             return None
 
-        suffix = file_path.suffix.lower()
+        return FormatUtils.detect_format_from_suffix(file_path.suffix)
 
-        for format_name, extensions in FormatUtils.FORMAT_EXTENSIONS.items():
-            if suffix in extensions:
-                return format_name
+    @staticmethod
+    def detect_format_from_suffix(suffix: str) -> str | None:
+        """
+        Detect format from a file extension without touching the filesystem.
+
+        Args:
+            suffix: File extension including the leading dot
 
-        return None
+        Returns:
+            Detected format or None
+        """
+        return FormatUtils._EXT_TO_FORMAT.get(suffix.lower())
 
     @staticmethod
-    def get_format_info(format_name: str) -> dict[str, Any]:
+    def get_format_info(format_name: str) -> Mapping[str, Any]:
         """
         Get comprehensive information about a format.
 
+        Results are cached per format and returned as read-only mappings.
+
         Args:
             format_name: Format name
 
         Returns:
-            Dictionary with format information
+            Mapping with format information
         """
         if not FormatUtils.validate_format(format_name):
             raise ValueError(f"Unsupported format: {format_name}")
 
-        format_name = format_name.lower()
+        return FormatUtils._format_info(format_name.lower())
 
-        info = {
-            "name": format_name,
-            "extensions": FormatUtils.FORMAT_EXTENSIONS[format_name],
-            "mimetypes": FormatUtils.FORMAT_MIMETYPES[format_name],
-            "ats_friendly": format_name in ["pdf", "docx"],
-            "web_compatible": format_name == "html",
-            "editable": format_name == "docx",
-            "print_ready": format_name in ["pdf", "docx"],
-        }
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _format_info(format_name: str) -> Mapping[str, Any]:
+        """Build the read-only info mapping for a lowercase format name."""
+        return MappingProxyType(
+            {
+                "name": format_name,
+                "extensions": tuple(FormatUtils.FORMAT_EXTENSIONS[format_name]),
+                "mimetypes": tuple(FormatUtils.FORMAT_MIMETYPES[format_name]),
+                "ats_friendly": format_name in ("pdf", "docx"),
+                "web_compatible": format_name == "html",
+                "editable": format_name == "docx",
+                "print_ready": format_name in ("pdf", "docx"),
+            }
+        )
 
-        return info
+
+def _formats_by_theme(
+    themes_by_format: dict[str, tuple[str, ...]],
+) -> dict[str, tuple[str, ...]]:
+    """Invert a format -> themes mapping into lowercase theme -> formats."""
+    formats_by_theme: dict[str, list[str]] = {}
+    for format_name, themes in themes_by_format.items():
+        for theme in themes:
+            formats_by_theme.setdefault(theme.lower(), []).append(format_name)
+    return {theme: tuple(formats) for theme, formats in formats_by_theme.items()}
 
 
 class ThemeUtils:
     """Utilities for theme discovery and validation."""
 
     AVAILABLE_THEMES = {
-        "html": ["professional", "modern", "minimal", "tech"],
-        "pdf": ["professional", "modern", "minimal", "tech"],
-        "docx": ["professional", "modern", "minimal"],
+        "html": ("professional", "modern", "minimal", "tech"),
+        "pdf": ("professional", "modern", "minimal", "tech"),
+        "docx": ("professional", "modern", "minimal"),
     }
 
     THEME_DESCRIPTIONS = {
@@ -252,13 +338,21 @@ class ThemeUtils:
         "tech": "Technology-focused with modern fonts and spacing",
     }
 
+    # Lowercased lookups derived once from AVAILABLE_THEMES
+    _AVAILABLE_THEMES_LOWER = {
+        format_name: frozenset(theme.lower() for theme in themes)
+        for format_name, themes in AVAILABLE_THEMES.items()
+    }
+    _THEME_TO_FORMATS = _formats_by_theme(AVAILABLE_THEMES)
+
     @staticmethod
-    def get_available_themes() -> dict[str, list[str]]:
+    def get_available_themes() -> dict[str, tuple[str, ...]]:
         """Get all available themes by format."""
         return ThemeUtils.AVAILABLE_THEMES.copy()
 
     @staticmethod
-    def get_themes_for_format(format_name: str) -> list[str]:
+    @lru_cache(maxsize=8)
+    def get_themes_for_format(format_name: str) -> tuple[str, ...]:
         """
         Get available themes for a specific format.
 
@@ -266,9 +360,9 @@ class ThemeUtils:
             format_name: Format name
 
         Returns:
-            List of available theme names
+            Tuple of available theme names
         """
-        return ThemeUtils.AVAILABLE_THEMES.get(format_name.lower(), [])
+        return ThemeUtils.AVAILABLE_THEMES.get(format_name.lower(), ())
 
     @staticmethod
     def validate_theme(format_name: str, theme_name: str) -> bool:
@@ -282,36 +376,111 @@ class ThemeUtils:
         Returns:
             True if theme is available for format
         """
-        available_themes = ThemeUtils.get_themes_for_format(format_name)
-        return theme_name.lower() in [t.lower() for t in available_themes]
+        available_themes = ThemeUtils._AVAILABLE_THEMES_LOWER.get(
+            format_name.lower(), frozenset()
+        )
+        return theme_name.lower() in available_themes
 
     @staticmethod
-    def get_theme_info(theme_name: str) -> dict[str, Any]:
+    def get_theme_info(theme_name: str) -> Mapping[str, Any]:
         """
         Get information about a theme.
 
+        Results are cached per theme and returned as read-only mappings.
+
         Args:
             theme_name: Theme name
 
         Returns:
-            Dictionary with theme information
+            Mapping with theme information
         """
-        theme_name = theme_name.lower()
+        return ThemeUtils._theme_info(theme_name.lower())
 
-        # Find which formats support this theme
-        supported_formats = []
-        for format_name, themes in ThemeUtils.AVAILABLE_THEMES.items():
-            if theme_name in [t.lower() for t in themes]:
-                supported_formats.append(format_name)
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _theme_info(theme_name: str) -> Mapping[str, Any]:
+        """Build the read-only info mapping for a lowercase theme name."""
+        return MappingProxyType(
+            {
+                "name": theme_name,
+                "description": ThemeUtils.THEME_DESCRIPTIONS.get(
+                    theme_name, "No description available"
+                ),
+                "supported_formats": ThemeUtils._THEME_TO_FORMATS.get(theme_name, ()),
+                "is_ats_friendly": theme_name in ("professional", "minimal"),
+            }
+        )
 
-        return {
-            "name": theme_name,
-            "description": ThemeUtils.THEME_DESCRIPTIONS.get(
-                theme_name, "No description available"
-            ),
-            "supported_formats": supported_formats,
-            "is_ats_friendly": theme_name in ["professional", "minimal"],
-        }
+
+_CREATED_AT_PLACEHOLDER = "__CREATED_AT__"
+
+# Static part of the sample configuration; only created_at varies per call
+_SAMPLE_CONFIG_TEMPLATE: dict[str, Any] = {
+    "version": "1.0",
+    "created_by": "resume-automation-cli",
+    "created_at": _CREATED_AT_PLACEHOLDER,
+    "ats_rules": {
+        "max_line_length": 80,
+        "bullet_style": "•",
+        "section_order": [
+            "contact",
+            "summary",
+            "experience",
+            "education",
+            "skills",
+        ],
+        "optimize_keywords": True,
+        "remove_special_chars": True,
+    },
+    "output_formats": {
+        "enabled_formats": ["html", "pdf", "docx"],
+        "html_theme": "professional",
+        "pdf_page_size": "Letter",
+        "docx_template": "professional",
+        "output_directory": "output",
+        "filename_prefix": "resume",
+        "overwrite_existing": True,
+    },
+    "styling": {
+        "theme": "professional",
+        "font_family": "Arial",
+        "font_size": 11,
+        "color_scheme": {
+            "primary": "#000000",
+            "secondary": "#333333",
+            "accent": "#0066cc",
+        },
+    },
+    "processing": {
+        "batch_size": 10,
+        "max_workers": 4,
+        "validate_input": True,
+        "validate_output": True,
+    },
+    "logging": {
+        "level": "INFO",
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def _sample_config_yaml() -> str:
+    """Serialize the sample configuration template once per process."""
+    import yaml
+
+    try:
+        from yaml import CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeDumper
+
+    return yaml.dump(
+        _SAMPLE_CONFIG_TEMPLATE,
+        Dumper=SafeDumper,
+        default_flow_style=False,
+        indent=2,
+        sort_keys=False,
+    )
 
 
 class ConfigUtils:
@@ -328,6 +497,10 @@ class ConfigUtils:
         Returns:
             Dictionary with validation results
         """
+        import yaml
+
+        from src.config import Config, ConfigValidator
+
         config_path = Path(config_path)
 
         result = {
@@ -346,19 +519,21 @@ class ConfigUtils:
             result["errors"].append(f"Configuration file does not exist: {config_path}")
             return result
 
-        # Check file readability
         try:
-            with open(config_path, encoding="utf-8") as f:
-                content = f.read()
-            result["file_readable"] = True
-        except Exception as e:
-            result["errors"].append(f"Cannot read configuration file: {e}")
-            return result
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
 
-        # Check YAML validity
+        # Check file readability and YAML validity, parsing straight from the file
         try:
-            config_data = yaml.safe_load(content)
+            with open(config_path, "rb") as f:
+                result["file_readable"] = True
+                config_data = yaml.load(f, Loader=SafeLoader)
             result["yaml_valid"] = True
+        except OSError as e:
+            result["file_readable"] = False
+            result["errors"].append(f"Cannot read configuration file: {e}")
+            return result
         except yaml.YAMLError as e:
             result["errors"].append(f"Invalid YAML syntax: {e}")
             return result
@@ -395,7 +570,7 @@ class ConfigUtils:
         return result
 
     @staticmethod
-    def _summarize_config(config: Config) -> dict[str, Any]:
+    def _summarize_config(config: "Config") -> dict[str, Any]:
         """Create a summary of configuration settings."""
         return {
             "ats_rules": {
@@ -428,59 +603,16 @@ class ConfigUtils:
         Args:
             output_path: Path where to create the sample config
         """
-        sample_config = {
-            "version": "1.0",
-            "created_by": "resume-automation-cli",
-            "created_at": datetime.now().isoformat(),
-            "ats_rules": {
-                "max_line_length": 80,
-                "bullet_style": "•",
-                "section_order": [
-                    "contact",
-                    "summary",
-                    "experience",
-                    "education",
-                    "skills",
-                ],
-                "optimize_keywords": True,
-                "remove_special_chars": True,
-            },
-            "output_formats": {
-                "enabled_formats": ["html", "pdf", "docx"],
-                "html_theme": "professional",
-                "pdf_page_size": "Letter",
-                "docx_template": "professional",
-                "output_directory": "output",
-                "filename_prefix": "resume",
-                "overwrite_existing": True,
-            },
-            "styling": {
-                "theme": "professional",
-                "font_family": "Arial",
-                "font_size": 11,
-                "color_scheme": {
-                    "primary": "#000000",
-                    "secondary": "#333333",
-                    "accent": "#0066cc",
-                },
-            },
-            "processing": {
-                "batch_size": 10,
-                "max_workers": 4,
-                "validate_input": True,
-                "validate_output": True,
-            },
-            "logging": {
-                "level": "INFO",
-                "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            },
-        }
+        # Quoted so the timestamp still loads back as a string, as yaml.dump emits it
+        sample_yaml = _sample_config_yaml().replace(
+            _CREATED_AT_PLACEHOLDER, f"'{datetime.now().isoformat()}'"
+        )
 
         output_path = Path(output_path)
 
         try:
             with open(output_path, "w", encoding="utf-8") as f:
-                yaml.dump(sample_config, f, default_flow_style=False, indent=2)
+                f.write(sample_yaml)
 
             logger.info(f"Sample configuration created: {output_path}")
 
@@ -520,19 +652,26 @@ class ResultUtils:
                 "error_count": len(result.errors),
                 "quality_score": ResultUtils._calculate_quality_score(result),
             },
-            "outputs": [
-                {
-                    "path": str(f),
-                    "format": FormatUtils.detect_format_from_file(f),
-                    "size": f.stat().st_size if f.exists() else 0,
-                    "exists": f.exists(),
-                }
-                for f in result.output_files
-            ],
+            "outputs": [ResultUtils._describe_output(f) for f in result.output_files],
         }
 
         return analysis
 
+    @staticmethod
+    def _describe_output(file_path: Path) -> dict[str, Any]:
+        """Describe one output file using a single stat() call."""
+        try:
+            size = os.stat(file_path).st_size
+        except OSError:
+            return {"path": str(file_path), "format": None, "size": 0, "exists": False}
+
+        return {
+            "path": str(file_path),
+            "format": FormatUtils.detect_format_from_suffix(file_path.suffix),
+            "size": size,
+            "exists": True,
+        }
+
     @staticmethod
     def analyze_batch_result(batch_result: BatchConversionResult) -> dict[str, Any]:
         """
@@ -544,10 +683,17 @@ class ResultUtils:
         Returns:
             Dictionary with analysis results
         """
-        individual_analyses = [
-            ResultUtils.analyze_conversion_result(result)
-            for result in batch_result.results
-        ]
+        individual_analyses = []
+        total_quality_score = 0.0
+        total_warnings = 0
+        total_errors = 0
+
+        for result in batch_result.results:
+            result_analysis = ResultUtils.analyze_conversion_result(result)
+            individual_analyses.append(result_analysis)
+            total_quality_score += result_analysis["quality"]["quality_score"]
+            total_warnings += len(result.warnings)
+            total_errors += len(result.errors)
 
         analysis = {
             "summary": {
@@ -570,11 +716,13 @@ class ResultUtils:
                 ),
             },
             "quality": {
-                "average_quality_score": ResultUtils._calculate_average_quality_score(
-                    individual_analyses
+                "average_quality_score": (
+                    total_quality_score / len(individual_analyses)
+                    if individual_analyses
+                    else 0.0
                 ),
-                "total_warnings": sum(len(r.warnings) for r in batch_result.results),
-                "total_errors": sum(len(r.errors) for r in batch_result.results),
+                "total_warnings": total_warnings,
+                "total_errors": total_errors,
             },
             "individual_results": individual_analyses,
         }
@@ -584,14 +732,9 @@ class ResultUtils:
     @staticmethod
     def _calculate_efficiency_rating(result: ConversionResult) -> str:
         """Calculate efficiency rating based on processing time."""
-        if result.processing_time < 2.0:
-            return "excellent"
-        elif result.processing_time < 5.0:
-            return "good"
-        elif result.processing_time < 10.0:
-            return "fair"
-        else:
-            return "poor"
+        return _EFFICIENCY_LABELS[
+            bisect_right(_EFFICIENCY_THRESHOLDS, result.processing_time)
+        ]
 
     @staticmethod
     def _calculate_quality_score(result: ConversionResult) -> float:
@@ -608,15 +751,6 @@ class ResultUtils:
 
         return max(0.0, base_score)
 
-    @staticmethod
-    def _calculate_average_quality_score(analyses: list[dict[str, Any]]) -> float:
-        """Calculate average quality score from individual analyses."""
-        if not analyses:
-            return 0.0
-
-        total_score = sum(a["quality"]["quality_score"] for a in analyses)
-        return total_score / len(analyses)
-
     @staticmethod
     def export_results_to_json(
         results: ConversionResult | BatchConversionResult,
@@ -626,12 +760,17 @@ class ResultUtils:
         """
         Export conversion results to JSON file.
 
+        Uses orjson when it is installed, which encodes straight to UTF-8
+        bytes, and falls back to the standard library json module.
+
         Args:
             results: Results to export
             output_path: Output file path
             include_analysis: Whether to include analysis
         """
         output_path = Path(output_path)
+        # Local alias for the per-file path conversion in large batches
+        fspath = os.fspath
 
         # Prepare data for export
         if isinstance(results, BatchConversionResult):
@@ -649,11 +788,11 @@ class ResultUtils:
                     {
                         "input_path": str(r.input_path),
                         "success": r.success,
-                        "output_files": [str(f) for f in r.output_files],
+                        "output_files": [fspath(f) for f in r.output_files],
                         "processing_time": r.processing_time,
                         "warnings": r.warnings,
                         "errors": r.errors,
-                        "metadata": r.metadata,
+                        "metadata": dict(r.metadata_or_empty),
                     }
                     for r in results.results
                 ],
@@ -668,19 +807,29 @@ class ResultUtils:
                 "timestamp": datetime.now().isoformat(),
                 "input_path": str(results.input_path),
                 "success": results.success,
-                "output_files": [str(f) for f in results.output_files],
+                "output_files": [fspath(f) for f in results.output_files],
                 "processing_time": results.processing_time,
                 "warnings": results.warnings,
                 "errors": results.errors,
-                "metadata": results.metadata,
+                "metadata": dict(results.metadata_or_empty),
             }
 
             if include_analysis:
                 export_data["analysis"] = ResultUtils.analyze_conversion_result(results)
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                with open(output_path, "wb") as f:
+                    f.write(
+                        orjson.dumps(
+                            export_data,
+                            default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                        )
+                    )
+            else:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
 
             logger.info(f"Results exported to: {output_path}")
 
@@ -6,7 +6,7 @@ used throughout the resume automation package.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """
     Result of validating resume content or structure.
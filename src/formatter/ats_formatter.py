@@ -6,7 +6,9 @@ rules to parsed resume data for optimal compatibility with Applicant Tracking Sy
 """
 
 import re
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict, TypeVar
+
+from pydantic import BaseModel
 
 from src.models import ResumeData, Experience, Education, ContactInfo, Skills, Project, Certification
 from .config import ATSConfig
@@ -14,6 +16,67 @@ from .date_standardizer import DateStandardizer
 from .header_standardizer import HeaderStandardizer
 
 
+# Typographic characters mapped to ATS-safe equivalents before cleaning.
+# A short chain of str.replace calls is cheaper here than str.translate,
+# whose dict-based tables are looked up per character for non-ASCII text.
+_CHAR_REPLACEMENTS = (
+    ('\u201c', '"'),  # Smart quotes to regular quotes
+    ('\u201d', '"'),
+    ('\u2018', "'"),
+    ('\u2019', "'"),
+    ('\u2014', '-'),  # Em dash to hyphen
+    ('\u2013', '-'),  # En dash to hyphen
+    ('\u2026', '...'),  # Ellipsis to periods
+)
+
+# ATS-unfriendly characters removed after replacement
+_SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s\-.,()&/]')
+
+# ASCII characters that cleaning would remove or turn into a space
+_ASCII_UNSAFE_PATTERN = re.compile(r'[^\w\-.,()&/ ]')
+
+# Separator for cleaning many short texts in one pass. NUL is neither a word
+# nor a whitespace character, so it survives cleaning when allowlisted.
+_LIST_SEPARATOR = '\x00'
+_SPECIAL_CHARS_LIST_PATTERN = re.compile(r'[^\w\s\-.,()&/\x00]')
+
+# Action verbs for bullet point optimization
+_ACTION_VERBS = frozenset({
+    'achieved', 'analyzed', 'built', 'collaborated', 'created', 'delivered',
+    'designed', 'developed', 'enhanced', 'established', 'executed', 'generated',
+    'implemented', 'improved', 'increased', 'launched', 'led', 'managed',
+    'optimized', 'organized', 'produced', 'reduced', 'resolved', 'streamlined'
+})
+
+# Maximum number of formatted resumes kept by format_resume_cached
+_FORMAT_CACHE_SIZE = 32
+
+
+_ModelT = TypeVar('_ModelT', bound=BaseModel)
+
+
+def _copy_with_changes(model: _ModelT, changes: Dict[str, Any]) -> _ModelT:
+    """
+    Apply formatted field values to a model copy-on-write.
+    
+    Unchanged models are returned as-is rather than copied, so the section
+    formatters must only be given models the caller owns; format_resume
+    passes entries from its own deep copy of the input.
+    
+    Args:
+        model: Resume entry being formatted
+        changes: Formatted values by field name
+        
+    Returns:
+        A copy with the values that differ, or the model itself if none do
+    """
+    changed = {
+        name: value for name, value in changes.items()
+        if value != getattr(model, name)
+    }
+    return model.model_copy(update=changed) if changed else model
+
+
 class ATSFormatter:
     """
     ATS compliance formatting engine for resume data.
@@ -37,16 +100,15 @@ class ATSFormatter:
         # Initialize header standardizer
         self.header_standardizer = HeaderStandardizer()
         
-        # ATS-unfriendly characters to remove/replace
-        self.special_chars_pattern = re.compile(r'[^\w\s\-.,()&/]')
+        # Pattern and verb set are shared module constants; only the
+        # config varies between formatter instances
+        self.special_chars_pattern = _SPECIAL_CHARS_PATTERN
         
         # Action verbs for bullet point optimization
-        self.action_verbs = {
-            'achieved', 'analyzed', 'built', 'collaborated', 'created', 'delivered',
-            'designed', 'developed', 'enhanced', 'established', 'executed', 'generated',
-            'implemented', 'improved', 'increased', 'launched', 'led', 'managed',
-            'optimized', 'organized', 'produced', 'reduced', 'resolved', 'streamlined'
-        }
+        self.action_verbs = _ACTION_VERBS
+        
+        # Serialized formatted results keyed by config and resume content
+        self._format_cache: Dict[str, str] = {}
     
     def format_resume(self, resume_data: ResumeData) -> ResumeData:
         """
@@ -64,7 +126,8 @@ class ATSFormatter:
         if not resume_data:
             raise ValueError("Resume data cannot be None")
         
-        # Create a copy to avoid modifying original data
+        # Deep copy so the result shares no mutable state with the input;
+        # section formatters then only replace the entries they change
         formatted_data = resume_data.model_copy(deep=True)
         
         # Apply formatting to each section
@@ -74,27 +137,27 @@ class ATSFormatter:
             formatted_data.summary = self._format_summary(formatted_data.summary)
         
         if formatted_data.experience:
-            formatted_data.experience = [
-                self._format_experience(exp) for exp in formatted_data.experience
-            ]
+            formatted_data.experience = list(
+                map(self._format_experience, formatted_data.experience)
+            )
         
         if formatted_data.education:
-            formatted_data.education = [
-                self._format_education(edu) for edu in formatted_data.education
-            ]
+            formatted_data.education = list(
+                map(self._format_education, formatted_data.education)
+            )
         
         if formatted_data.skills:
             formatted_data.skills = self._format_skills(formatted_data.skills)
         
         if formatted_data.projects:
-            formatted_data.projects = [
-                self._format_project(proj) for proj in formatted_data.projects
-            ]
+            formatted_data.projects = list(
+                map(self._format_project, formatted_data.projects)
+            )
         
         if formatted_data.certifications:
-            formatted_data.certifications = [
-                self._format_certification(cert) for cert in formatted_data.certifications
-            ]
+            formatted_data.certifications = list(
+                map(self._format_certification, formatted_data.certifications)
+            )
         
         # Validate ATS compliance
         if not self.validate_ats_compliance(formatted_data):
@@ -102,6 +165,42 @@ class ATSFormatter:
         
         return formatted_data
     
+    def format_resume_cached(self, resume_data: ResumeData) -> ResumeData:
+        """
+        Apply ATS formatting rules, reusing results for identical resumes.
+        
+        Results are keyed on the serialized resume content and the current
+        config, so repeated formatting of the same resume (previews,
+        regeneration) is a lookup. Each call returns its own copy.
+        
+        Args:
+            resume_data: Parsed resume data to format
+            
+        Returns:
+            ATS-formatted resume data
+            
+        Raises:
+            ValueError: If resume data is invalid
+        """
+        if not resume_data:
+            raise ValueError("Resume data cannot be None")
+        
+        cache_key = f"{self.config!r}\n{resume_data.model_dump_json()}"
+        
+        # Results are stored serialized, so no cached object is ever shared
+        # with a caller; each hit rebuilds a fresh model
+        formatted_json = self._format_cache.get(cache_key)
+        if formatted_json is not None:
+            return ResumeData.model_validate_json(formatted_json)
+        
+        formatted_data = self.format_resume(resume_data)
+        if len(self._format_cache) >= _FORMAT_CACHE_SIZE:
+            # Evict the oldest entry
+            del self._format_cache[next(iter(self._format_cache))]
+        self._format_cache[cache_key] = formatted_data.model_dump_json()
+        
+        return formatted_data
+    
     def _format_contact(self, contact: ContactInfo) -> ContactInfo:
         """
         Format contact information for ATS compliance.
@@ -112,15 +211,15 @@ class ATSFormatter:
         Returns:
             ATS-formatted contact information
         """
-        formatted_contact = contact.model_copy()
+        changes: Dict[str, Any] = {}
         
         # Clean special characters from name and location
         if self.config.remove_special_chars:
-            formatted_contact.name = self._clean_special_chars(formatted_contact.name)
-            if formatted_contact.location:
-                formatted_contact.location = self._clean_special_chars(formatted_contact.location)
+            changes['name'] = self._clean_special_chars(contact.name)
+            if contact.location:
+                changes['location'] = self._clean_special_chars(contact.location)
         
-        return formatted_contact
+        return _copy_with_changes(contact, changes)
     
     def _format_summary(self, summary: str) -> str:
         """
@@ -153,29 +252,31 @@ class ATSFormatter:
         Returns:
             ATS-formatted experience entry
         """
-        formatted_exp = experience.model_copy()
+        changes: Dict[str, Any] = {}
         
         # Clean special characters
         if self.config.remove_special_chars:
-            formatted_exp.title = self._clean_special_chars(formatted_exp.title)
-            formatted_exp.company = self._clean_special_chars(formatted_exp.company)
-            if formatted_exp.location:
-                formatted_exp.location = self._clean_special_chars(formatted_exp.location)
+            changes['title'] = self._clean_special_chars(experience.title)
+            changes['company'] = self._clean_special_chars(experience.company)
+            if experience.location:
+                changes['location'] = self._clean_special_chars(experience.location)
         
         # Standardize dates
-        formatted_exp.start_date = self.date_standardizer.standardize_date(formatted_exp.start_date)
-        formatted_exp.end_date = self.date_standardizer.standardize_date(formatted_exp.end_date)
+        start_date = self.date_standardizer.standardize_date(experience.start_date)
+        end_date = self.date_standardizer.standardize_date(experience.end_date)
+        changes['start_date'] = start_date
+        changes['end_date'] = end_date
         
         # Validate date order
-        if not self.date_standardizer.validate_date_order(formatted_exp.start_date, formatted_exp.end_date):
+        if not self.date_standardizer.validate_date_order(start_date, end_date):
             # Log warning but don't fail - let validation catch this later
             pass
         
         # Format bullet points
-        if formatted_exp.bullets:
-            formatted_exp.bullets = self.optimize_bullet_points(formatted_exp.bullets)
+        if experience.bullets:
+            changes['bullets'] = self.optimize_bullet_points(experience.bullets)
         
-        return formatted_exp
+        return _copy_with_changes(experience, changes)
     
     def _format_education(self, education: Education) -> Education:
         """
@@ -187,28 +288,30 @@ class ATSFormatter:
         Returns:
             ATS-formatted education entry
         """
-        formatted_edu = education.model_copy()
+        changes: Dict[str, Any] = {}
         
         # Clean special characters
         if self.config.remove_special_chars:
-            formatted_edu.degree = self._clean_special_chars(formatted_edu.degree)
-            formatted_edu.school = self._clean_special_chars(formatted_edu.school)
-            if formatted_edu.location:
-                formatted_edu.location = self._clean_special_chars(formatted_edu.location)
+            changes['degree'] = self._clean_special_chars(education.degree)
+            changes['school'] = self._clean_special_chars(education.school)
+            if education.location:
+                changes['location'] = self._clean_special_chars(education.location)
         
         # Standardize dates if present
-        if formatted_edu.start_date:
-            formatted_edu.start_date = self.date_standardizer.standardize_date(formatted_edu.start_date)
-        if formatted_edu.end_date:
-            formatted_edu.end_date = self.date_standardizer.standardize_date(formatted_edu.end_date)
+        start_date = education.start_date
+        end_date = education.end_date
+        if start_date:
+            start_date = changes['start_date'] = self.date_standardizer.standardize_date(start_date)
+        if end_date:
+            end_date = changes['end_date'] = self.date_standardizer.standardize_date(end_date)
         
         # Validate date order if both dates exist
-        if (formatted_edu.start_date and formatted_edu.end_date and 
-            not self.date_standardizer.validate_date_order(formatted_edu.start_date, formatted_edu.end_date)):
+        if (start_date and end_date and 
+            not self.date_standardizer.validate_date_order(start_date, end_date)):
             # Log warning but don't fail - let validation catch this later
             pass
         
-        return formatted_edu
+        return _copy_with_changes(education, changes)
     
     def _format_skills(self, skills: Skills) -> Skills:
         """
@@ -220,22 +323,32 @@ class ATSFormatter:
         Returns:
             ATS-formatted skills section
         """
-        formatted_skills = skills.model_copy()
+        changes: Dict[str, Any] = {}
         
         # Clean special characters from skill names
-        if self.config.remove_special_chars and formatted_skills.categories:
-            for category in formatted_skills.categories:
-                category.name = self._clean_special_chars(category.name)
-                category.skills = [
-                    self._clean_special_chars(skill) for skill in category.skills
-                ]
-        
-        if self.config.remove_special_chars and formatted_skills.raw_skills:
-            formatted_skills.raw_skills = [
-                self._clean_special_chars(skill) for skill in formatted_skills.raw_skills
-            ]
-        
-        return formatted_skills
+        if self.config.remove_special_chars and skills.categories:
+            # Clean every category name and skill together, then split back
+            cleaned = self._clean_special_chars_list([
+                text
+                for category in skills.categories
+                for text in (category.name, *category.skills)
+            ])
+            
+            formatted_categories = []
+            position = 0
+            for category in skills.categories:
+                skills_end = position + 1 + len(category.skills)
+                formatted_categories.append(_copy_with_changes(category, {
+                    'name': cleaned[position],
+                    'skills': cleaned[position + 1:skills_end],
+                }))
+                position = skills_end
+            changes['categories'] = formatted_categories
+        
+        if self.config.remove_special_chars and skills.raw_skills:
+            changes['raw_skills'] = self._clean_special_chars_list(skills.raw_skills)
+        
+        return _copy_with_changes(skills, changes)
     
     def _format_project(self, project: Project) -> Project:
         """
@@ -247,23 +360,23 @@ class ATSFormatter:
         Returns:
             ATS-formatted project entry
         """
-        formatted_proj = project.model_copy()
+        changes: Dict[str, Any] = {}
         
         # Clean special characters
         if self.config.remove_special_chars:
-            formatted_proj.name = self._clean_special_chars(formatted_proj.name)
-            if formatted_proj.description:
-                formatted_proj.description = self._clean_special_chars(formatted_proj.description)
+            changes['name'] = self._clean_special_chars(project.name)
+            if project.description:
+                changes['description'] = self._clean_special_chars(project.description)
         
         # Standardize date if present
-        if formatted_proj.date:
-            formatted_proj.date = self.date_standardizer.standardize_date(formatted_proj.date)
+        if project.date:
+            changes['date'] = self.date_standardizer.standardize_date(project.date)
         
         # Format bullet points if present
-        if formatted_proj.bullets:
-            formatted_proj.bullets = self.optimize_bullet_points(formatted_proj.bullets)
+        if project.bullets:
+            changes['bullets'] = self.optimize_bullet_points(project.bullets)
         
-        return formatted_proj
+        return _copy_with_changes(project, changes)
     
     def _format_certification(self, certification: Certification) -> Certification:
         """
@@ -275,25 +388,26 @@ class ATSFormatter:
         Returns:
             ATS-formatted certification entry
         """
-        formatted_cert = certification.model_copy()
+        changes: Dict[str, Any] = {}
         
         # Clean special characters
         if self.config.remove_special_chars:
-            formatted_cert.name = self._clean_special_chars(formatted_cert.name)
-            formatted_cert.issuer = self._clean_special_chars(formatted_cert.issuer)
+            changes['name'] = self._clean_special_chars(certification.name)
+            changes['issuer'] = self._clean_special_chars(certification.issuer)
         
         # Standardize dates
-        formatted_cert.date = self.date_standardizer.standardize_date(formatted_cert.date)
-        if formatted_cert.expiry:
-            formatted_cert.expiry = self.date_standardizer.standardize_date(formatted_cert.expiry)
+        date = changes['date'] = self.date_standardizer.standardize_date(certification.date)
+        expiry = certification.expiry
+        if expiry:
+            expiry = changes['expiry'] = self.date_standardizer.standardize_date(expiry)
         
         # Validate date order if both dates exist
-        if (formatted_cert.expiry and 
-            not self.date_standardizer.validate_date_order(formatted_cert.date, formatted_cert.expiry)):
+        if (expiry and 
+            not self.date_standardizer.validate_date_order(date, expiry)):
             # Log warning but don't fail - let validation catch this later
             pass
         
-        return formatted_cert
+        return _copy_with_changes(certification, changes)
     
     def optimize_bullet_points(self, bullets: List[str]) -> List[str]:
         """
@@ -311,26 +425,30 @@ class ATSFormatter:
         if not bullets:
             return bullets
         
-        optimized_bullets = []
+        optimized_bullets: List[str] = []
+        
+        # Resolve per-call settings and methods once for the loop
+        remove_special_chars = self.config.remove_special_chars
+        clean_special_chars = self._clean_special_chars
+        wrap_text = self._wrap_text
+        append = optimized_bullets.append
         
         for bullet in bullets:
-            if not bullet.strip():
-                continue
-            
-            # Clean the bullet text
+            # Clean the bullet text, skipping empty bullets
             cleaned_bullet = bullet.strip()
+            if not cleaned_bullet:
+                continue
             
             # Remove special characters if configured
-            if self.config.remove_special_chars:
-                cleaned_bullet = self._clean_special_chars(cleaned_bullet)
+            if remove_special_chars:
+                cleaned_bullet = clean_special_chars(cleaned_bullet)
             
-            # Ensure proper capitalization
-            cleaned_bullet = cleaned_bullet[0].upper() + cleaned_bullet[1:] if cleaned_bullet else ""
+            # Ensure proper capitalization; most bullets already start with one
+            if cleaned_bullet and not cleaned_bullet[0].isupper():
+                cleaned_bullet = cleaned_bullet[0].upper() + cleaned_bullet[1:]
             
             # Wrap text to respect line length
-            wrapped_bullet = self._wrap_text(cleaned_bullet)
-            
-            optimized_bullets.append(wrapped_bullet)
+            append(wrap_text(cleaned_bullet))
         
         return optimized_bullets
     
@@ -386,12 +504,11 @@ class ATSFormatter:
                 for exp in resume_data.experience:
                     sections_to_check.extend(exp.bullets or [])
             
-            # Check line lengths
-            for content in sections_to_check:
-                lines = content.split('\n')
-                for line in lines:
-                    if len(line) > self.config.max_line_length:
-                        return False
+            # Check line lengths of all content in one pass
+            if sections_to_check:
+                lines = '\n'.join(sections_to_check).split('\n')
+                if max(map(len, lines)) > self.config.max_line_length:
+                    return False
             
             return True
             
@@ -411,29 +528,53 @@ class ATSFormatter:
         if not text:
             return text
         
-        # Replace common problematic characters
-        replacements = {
-            '"': '"',  # Smart quotes to regular quotes
-            '"': '"',
-            ''': "'",
-            ''': "'",
-            '—': '-',  # Em dash to hyphen
-            '–': '-',  # En dash to hyphen
-            '…': '...'  # Ellipsis to periods
-        }
+        # Most fields are already clean ASCII; the typographic replacements
+        # are all non-ASCII, so only removals and spacing need checking
+        if (text.isascii() and text[0] != ' ' and text[-1] != ' '
+                and '  ' not in text and not _ASCII_UNSAFE_PATTERN.search(text)):
+            return text
         
+        # Replace common problematic characters
         cleaned = text
-        for old, new in replacements.items():
+        for old, new in _CHAR_REPLACEMENTS:
             cleaned = cleaned.replace(old, new)
         
         # Remove any remaining special characters
-        cleaned = self.special_chars_pattern.sub('', cleaned)
+        cleaned = _SPECIAL_CHARS_PATTERN.sub('', cleaned)
         
         # Clean up extra spaces
         cleaned = ' '.join(cleaned.split())
         
         return cleaned
     
+    def _clean_special_chars_list(self, texts: List[str]) -> List[str]:
+        """
+        Remove ATS-unfriendly special characters from a list of short texts.
+        
+        The texts are joined with a separator and cleaned in one pass, which
+        avoids a replace/regex round per item for long skill lists.
+        
+        Args:
+            texts: Texts to clean
+            
+        Returns:
+            Cleaned texts, in the same order
+        """
+        joined = _LIST_SEPARATOR.join(texts)
+        if joined.count(_LIST_SEPARATOR) != len(texts) - 1:
+            # A text contains the separator itself; clean items one by one
+            return [self._clean_special_chars(text) for text in texts]
+        
+        # Replace common problematic characters
+        for old, new in _CHAR_REPLACEMENTS:
+            joined = joined.replace(old, new)
+        
+        # Remove any remaining special characters, keeping the separators
+        joined = _SPECIAL_CHARS_LIST_PATTERN.sub('', joined)
+        
+        # Clean up extra spaces in each text
+        return [' '.join(part.split()) for part in joined.split(_LIST_SEPARATOR)]
+    
     def _wrap_text(self, text: str) -> str:
         """
         Wrap text to respect maximum line length.
@@ -444,11 +585,16 @@ class ATSFormatter:
         Returns:
             Wrapped text with proper line breaks
         """
-        if not text or len(text) <= self.config.max_line_length:
+        max_line_length = self.config.max_line_length
+        if not text or len(text) <= max_line_length:
             return text
         
         # Simple word-based wrapping
         words = text.split()
+        if len(words) < 2:
+            # A single unbreakable token (e.g. a URL) has nothing to wrap
+            return words[0] if words else ''
+        
         lines: List[str] = []
         current_line: List[str] = []
         current_length = 0
@@ -457,7 +603,7 @@ class ATSFormatter:
             # Check if adding this word would exceed line length
             word_length = len(word) + (1 if current_line else 0)  # +1 for space
             
-            if current_length + word_length > self.config.max_line_length and current_line:
+            if current_length + word_length > max_line_length and current_line:
                 # Start new line
                 lines.append(' '.join(current_line))
                 current_line = [word]
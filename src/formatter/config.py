@@ -8,7 +8,7 @@ from typing import List, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class ATSConfig:
     """
     Configuration for ATS formatting rules.
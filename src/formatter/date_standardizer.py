@@ -6,7 +6,143 @@ into ATS-compliant formats for optimal parsing.
 """
 
 import re
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional
+
+
+# Month name mappings for standardization
+_MONTH_MAPPINGS: Dict[str, str] = {
+    'january': 'January', 'jan': 'January',
+    'february': 'February', 'feb': 'February',
+    'march': 'March', 'mar': 'March',
+    'april': 'April', 'apr': 'April',
+    'may': 'May',
+    'june': 'June', 'jun': 'June',
+    'july': 'July', 'jul': 'July',
+    'august': 'August', 'aug': 'August',
+    'september': 'September', 'sep': 'September', 'sept': 'September',
+    'october': 'October', 'oct': 'October',
+    'november': 'November', 'nov': 'November',
+    'december': 'December', 'dec': 'December'
+}
+# Title-case spellings ("Jan", "January") as written in most resumes, so the
+# common case is a single lookup without lowercasing
+_MONTH_MAPPINGS.update({
+    month_key.title(): month_name for month_key, month_name in _MONTH_MAPPINGS.items()
+})
+
+# Present/Current variations
+_PRESENT_VARIATIONS = frozenset({
+    'present', 'current', 'now', 'ongoing', 'today'
+})
+_PRESENT_MAX_LENGTH = max(map(len, _PRESENT_VARIATIONS))
+
+# All supported date formats as one alternation, tried in order by a single
+# match call. The "Month YYYY" prefix is shared by ranges and single dates:
+#   "January 2020 - Present" / "Jan 2020 - Dec 2021" / "January 2020"
+#   "2020 - 2021" / "2020 - Present"
+#   "2020"
+# There are no letter literals, so no case folding is needed; month and
+# present names are normalized by the lookups below.
+_DATE_PATTERN = re.compile(
+    r'(?P<month>\w+)\s+(?P<year>\d{4})'
+    r'(?:\s*[-–—]\s*(?P<end>\w+)(?:\s+(?P<end_year>\d{4}))?)?'
+    r'|(?P<start_year>\d{4})\s*[-–—]\s*(?P<end_part>\w+)'
+    r'|(?P<year_only>\d{4})$'
+)
+
+# Standalone 4-digit year anywhere in a date string
+_YEAR_PATTERN = re.compile(r'\b(\d{4})\b')
+
+
+# Resumes repeat the same date strings across entries, so the parsing
+# helpers are memoized at module level and shared by all instances
+
+@lru_cache(maxsize=4096)
+def _standardize_date(cleaned_date: str) -> str:
+    """Standardize a stripped, non-empty date string."""
+    match = _DATE_PATTERN.match(cleaned_date)
+    if match:
+        return _format_date_match(match)
+    
+    # If no pattern matches, return cleaned original
+    return cleaned_date
+
+
+def _format_date_match(match: re.Match) -> str:
+    """Format a date pattern match into standardized format."""
+    start_year = match['start_year']
+    if start_year is not None:  # Year - Year/Present
+        end_part = match['end_part']
+        if _is_present_date(end_part):
+            return f"{start_year} - Present"
+        return f"{start_year} - {end_part}"
+    
+    month = match['month']
+    if month is None:  # Single year
+        return match['year_only']
+    
+    year = match['year']
+    end = match['end']
+    if end is None:  # Month Year, or two bare years
+        if month.isdigit() and len(month) == 4:
+            return f"{month} - {year}"
+        return f"{_standardize_month(month)} {year}"
+    
+    # Full date range; the end part may be a month or a present variation
+    start_month_std = _standardize_month(month)
+    if _is_present_date(end):
+        return f"{start_month_std} {year} - Present"
+    
+    end_month_std = _standardize_month(end)
+    end_year = match['end_year']
+    if end_year:
+        return f"{start_month_std} {year} - {end_month_std} {end_year}"
+    return f"{start_month_std} {year} - {end_month_std}"
+
+
+def _standardize_month(month_str: str) -> str:
+    """Standardize month name to full month name."""
+    if not month_str:
+        return month_str
+    
+    month_std = _MONTH_MAPPINGS.get(month_str)
+    if month_std is not None:
+        return month_std
+    
+    month_lower = month_str.lower().strip()
+    return _MONTH_MAPPINGS.get(month_lower, month_str.title())
+
+
+@lru_cache(maxsize=256)
+def _is_present_date(date_str: str) -> bool:
+    """Check if date string represents present/current."""
+    if not date_str:
+        return False
+    
+    # Reject longer unpadded strings ("December 2021") without lowercasing
+    if (len(date_str) > _PRESENT_MAX_LENGTH
+            and not date_str[0].isspace() and not date_str[-1].isspace()):
+        return False
+    
+    return date_str.lower().strip() in _PRESENT_VARIATIONS
+
+
+@lru_cache(maxsize=1024)
+def _extract_year(date_str: str) -> Optional[int]:
+    """Extract the first 4-digit year from a date string."""
+    if not date_str:
+        return None
+    
+    # Look for 4-digit year
+    year_match = _YEAR_PATTERN.search(date_str)
+    if year_match:
+        try:
+            return int(year_match.group(1))
+        except ValueError:
+            pass
+    
+    return None
 
 
 class DateStandardizer:
@@ -18,40 +154,12 @@ class DateStandardizer:
     """
     
     def __init__(self) -> None:
-        """Initialize date standardizer with regex patterns."""
-        # Month name mappings for standardization
-        self.month_mappings = {
-            'january': 'January', 'jan': 'January',
-            'february': 'February', 'feb': 'February',
-            'march': 'March', 'mar': 'March',
-            'april': 'April', 'apr': 'April',
-            'may': 'May',
-            'june': 'June', 'jun': 'June',
-            'july': 'July', 'jul': 'July',
-            'august': 'August', 'aug': 'August',
-            'september': 'September', 'sep': 'September', 'sept': 'September',
-            'october': 'October', 'oct': 'October',
-            'november': 'November', 'nov': 'November',
-            'december': 'December', 'dec': 'December'
-        }
-        
-        # Present/Current variations
-        self.present_variations = {
-            'present', 'current', 'now', 'ongoing', 'today'
-        }
-        
-        # Regex patterns for different date formats
-        self.date_patterns = [
-            # "January 2020 - Present" or "January 2020 - December 2021"
-            re.compile(r'(\w+)\s+(\d{4})\s*[-–—]\s*(\w+)(?:\s+(\d{4}))?', re.IGNORECASE),
-            # "Jan 2020 - Dec 2021" 
-            re.compile(r'(\w+)\s+(\d{4})\s*[-–—]\s*(\w+)\s+(\d{4})', re.IGNORECASE),
-            # "2020 - 2021" or "2020 - Present"
-            re.compile(r'(\d{4})\s*[-–—]\s*(\w+|\d{4})', re.IGNORECASE),
-            # Single dates: "January 2020" or "2020"
-            re.compile(r'(\w+)\s+(\d{4})', re.IGNORECASE),
-            re.compile(r'^(\d{4})$', re.IGNORECASE)
-        ]
+        """Initialize date standardizer with the date regex."""
+        # Lookup tables are shared module constants so parsed dates can be
+        # memoized across every standardizer instance
+        self.month_mappings = _MONTH_MAPPINGS
+        self.present_variations = _PRESENT_VARIATIONS
+        self.date_pattern = _DATE_PATTERN
     
     def standardize_date(self, date_str: str) -> str:
         """
@@ -71,16 +179,7 @@ class DateStandardizer:
         if not date_str or not date_str.strip():
             return date_str
         
-        cleaned_date = date_str.strip()
-        
-        # Try each pattern until we find a match
-        for pattern in self.date_patterns:
-            match = pattern.match(cleaned_date)
-            if match:
-                return self._format_matched_date(match.groups(), cleaned_date)
-        
-        # If no pattern matches, return cleaned original
-        return cleaned_date
+        return _standardize_date(date_str.strip())
     
     def standardize_date_range(self, start_date: str, end_date: str) -> tuple[str, str]:
         """
@@ -125,66 +224,6 @@ class DateStandardizer:
         except Exception:
             return True  # If parsing fails, assume valid
     
-    def _format_matched_date(self, groups: tuple[str, ...], original: str) -> str:
-        """
-        Format matched date groups into standardized format.
-        
-        Args:
-            groups: Regex match groups
-            original: Original date string as fallback
-            
-        Returns:
-            Formatted date string
-        """
-        if len(groups) == 4:  # Full date range
-            start_month, start_year, end_part, end_year = groups
-            
-            # Standardize start month
-            start_month_std = self._standardize_month(start_month)
-            
-            # Handle end part (could be month or present variation)
-            if self._is_present_date(end_part):
-                return f"{start_month_std} {start_year} - Present"
-            else:
-                end_month_std = self._standardize_month(end_part)
-                if end_year:
-                    return f"{start_month_std} {start_year} - {end_month_std} {end_year}"
-                else:
-                    return f"{start_month_std} {start_year} - {end_month_std}"
-        
-        elif len(groups) == 3:  # Month Year - Month/Year or Year - Year/Present
-            first, second, third = groups
-            
-            if first.isdigit() and len(first) == 4:  # Year - Year/Present format
-                if self._is_present_date(third):
-                    return f"{first} - Present"
-                else:
-                    return f"{first} - {third}"
-            else:  # Month Year - Month format
-                start_month_std = self._standardize_month(first)
-                if self._is_present_date(third):
-                    return f"{start_month_std} {second} - Present"
-                else:
-                    end_month_std = self._standardize_month(third)
-                    return f"{start_month_std} {second} - {end_month_std}"
-        
-        elif len(groups) == 2:  # Month Year or Year - Year/Present
-            first, second = groups
-            
-            if first.isdigit() and len(first) == 4:  # Year - Year/Present
-                if self._is_present_date(second):
-                    return f"{first} - Present"
-                else:
-                    return f"{first} - {second}"
-            else:  # Month Year
-                month_std = self._standardize_month(first)
-                return f"{month_std} {second}"
-        
-        elif len(groups) == 1:  # Single year
-            return str(groups[0])
-        
-        return original
-    
     def _standardize_month(self, month_str: str) -> str:
         """
         Standardize month name to full month name.
@@ -195,11 +234,7 @@ class DateStandardizer:
         Returns:
             Standardized month name
         """
-        if not month_str:
-            return month_str
-        
-        month_lower = month_str.lower().strip()
-        return self.month_mappings.get(month_lower, month_str.title())
+        return _standardize_month(month_str)
     
     def _is_present_date(self, date_str: str) -> bool:
         """
@@ -211,10 +246,7 @@ class DateStandardizer:
         Returns:
             True if represents present, False otherwise
         """
-        if not date_str:
-            return False
-        
-        return date_str.lower().strip() in self.present_variations
+        return _is_present_date(date_str)
     
     def _extract_year(self, date_str: str) -> Optional[int]:
         """
@@ -226,15 +258,4 @@ class DateStandardizer:
         Returns:
             Extracted year as integer, or None if not found
         """
-        if not date_str:
-            return None
-        
-        # Look for 4-digit year
-        year_match = re.search(r'\b(\d{4})\b', date_str)
-        if year_match:
-            try:
-                return int(year_match.group(1))
-            except ValueError:
-                pass
-        
-        return None
+        return _extract_year(date_str)
@@ -8,6 +8,83 @@ into ATS-compliant formats for optimal parsing.
 from typing import List, Optional, Dict
 
 
+# Standard ATS headers
+_STANDARD_HEADERS: Dict[str, str] = {
+    'summary': 'Summary',
+    'experience': 'Experience',
+    'education': 'Education',
+    'skills': 'Skills',
+    'certifications': 'Certifications',
+    'projects': 'Projects',
+    'contact': 'Contact Information'
+}
+
+# Header variations mapping to standard headers
+_HEADER_MAPPINGS: Dict[str, set] = {
+    # Summary variations
+    'summary': {'summary', 'professional summary', 'executive summary', 'profile', 
+               'professional profile', 'career summary', 'overview', 'objective',
+               'career objective', 'professional objective'},
+
+    # Experience variations
+    'experience': {'experience', 'work experience', 'professional experience',
+                  'employment', 'employment history', 'work history',
+                  'career history', 'professional background', 'positions held',
+                  'relevant experience'},
+
+    # Education variations
+    'education': {'education', 'academic background', 'academic history',
+                 'educational background', 'academic qualifications',
+                 'qualifications', 'academic credentials', 'degrees',
+                 'education and training', 'formal education'},
+
+    # Skills variations
+    'skills': {'skills', 'technical skills', 'core competencies',
+              'competencies', 'areas of expertise', 'expertise',
+              'capabilities', 'proficiencies', 'technical proficiencies',
+              'key skills', 'skill set', 'technologies'},
+
+    # Certifications variations
+    'certifications': {'certifications', 'certificates', 'professional certifications',
+                      'licenses', 'licenses and certifications', 'credentials',
+                      'professional credentials', 'accreditations',
+                      'professional development', 'training'},
+
+    # Projects variations
+    'projects': {'projects', 'key projects', 'notable projects',
+                'project experience', 'selected projects',
+                'project portfolio', 'accomplishments',
+                'key accomplishments', 'achievements'},
+
+    # Contact variations
+    'contact': {'contact', 'contact information', 'contact details',
+               'personal information', 'personal details', 'contact info'}
+}
+
+# Reverse mapping for efficient lookup, built once at import
+_REVERSE_MAPPING: Dict[str, str] = {
+    variation.lower(): standard
+    for standard, variations in _HEADER_MAPPINGS.items()
+    for variation in variations
+}
+
+_STANDARD_HEADER_VALUES = frozenset(_STANDARD_HEADERS.values())
+
+# ATS-preferred header order as a rank lookup
+_PREFERRED_ORDER = [
+    'Contact Information',
+    'Summary',
+    'Experience',
+    'Education',
+    'Skills',
+    'Projects',
+    'Certifications'
+]
+_ORDER_RANK: Dict[str, int] = {
+    header: rank for rank, header in enumerate(_PREFERRED_ORDER)
+}
+
+
 class HeaderStandardizer:
     """
     Standardize section headers for ATS compliance.
@@ -18,64 +95,11 @@ class HeaderStandardizer:
     
     def __init__(self) -> None:
         """Initialize header standardizer with mapping rules."""
-        # Standard ATS headers
-        self.standard_headers = {
-            'summary': 'Summary',
-            'experience': 'Experience',
-            'education': 'Education',
-            'skills': 'Skills',
-            'certifications': 'Certifications',
-            'projects': 'Projects',
-            'contact': 'Contact Information'
-        }
-        
-        # Header variations mapping to standard headers
-        self.header_mappings = {
-            # Summary variations
-            'summary': {'summary', 'professional summary', 'executive summary', 'profile', 
-                       'professional profile', 'career summary', 'overview', 'objective',
-                       'career objective', 'professional objective'},
-            
-            # Experience variations
-            'experience': {'experience', 'work experience', 'professional experience',
-                          'employment', 'employment history', 'work history',
-                          'career history', 'professional background', 'positions held',
-                          'relevant experience'},
-            
-            # Education variations
-            'education': {'education', 'academic background', 'academic history',
-                         'educational background', 'academic qualifications',
-                         'qualifications', 'academic credentials', 'degrees',
-                         'education and training', 'formal education'},
-            
-            # Skills variations
-            'skills': {'skills', 'technical skills', 'core competencies',
-                      'competencies', 'areas of expertise', 'expertise',
-                      'capabilities', 'proficiencies', 'technical proficiencies',
-                      'key skills', 'skill set', 'technologies'},
-            
-            # Certifications variations
-            'certifications': {'certifications', 'certificates', 'professional certifications',
-                              'licenses', 'licenses and certifications', 'credentials',
-                              'professional credentials', 'accreditations',
-                              'professional development', 'training'},
-            
-            # Projects variations
-            'projects': {'projects', 'key projects', 'notable projects',
-                        'project experience', 'selected projects',
-                        'project portfolio', 'accomplishments',
-                        'key accomplishments', 'achievements'},
-            
-            # Contact variations
-            'contact': {'contact', 'contact information', 'contact details',
-                       'personal information', 'personal details', 'contact info'}
-        }
-        
-        # Create reverse mapping for efficient lookup
-        self.reverse_mapping: Dict[str, str] = {}
-        for standard, variations in self.header_mappings.items():
-            for variation in variations:
-                self.reverse_mapping[variation.lower()] = standard
+        # Mapping tables are shared module constants; every ATSFormatter
+        # creates its own standardizer, so they are built once at import
+        self.standard_headers = _STANDARD_HEADERS
+        self.header_mappings = _HEADER_MAPPINGS
+        self.reverse_mapping: Dict[str, str] = _REVERSE_MAPPING
     
     def standardize_header(self, header: str) -> str:
         """
@@ -117,7 +141,7 @@ class HeaderStandardizer:
         Returns:
             True if header is standard, False otherwise
         """
-        return header in self.standard_headers.values()
+        return header in _STANDARD_HEADER_VALUES
     
     def get_header_category(self, header: str) -> Optional[str]:
         """
@@ -172,24 +196,10 @@ class HeaderStandardizer:
         Returns:
             Reordered list of headers in ATS-preferred order
         """
-        # ATS-preferred order
-        preferred_order = [
-            'Contact Information',
-            'Summary',
-            'Experience',
-            'Education',
-            'Skills',
-            'Projects',
-            'Certifications'
-        ]
-        
         standardized = self.standardize_all_headers(headers)
         
-        # Sort based on preferred order
-        def order_key(header: str) -> int:
-            try:
-                return preferred_order.index(header)
-            except ValueError:
-                return len(preferred_order)  # Put unknown headers at the end
-        
-        return sorted(standardized, key=order_key)
+        # Sort based on preferred order, unknown headers at the end
+        unknown_rank = len(_PREFERRED_ORDER)
+        return sorted(
+            standardized, key=lambda header: _ORDER_RANK.get(header, unknown_rank)
+        )
@@ -7,6 +7,7 @@ ATS compliance formatting functionality.
 
 import pytest
 from typing import List
+from unittest.mock import patch
 
 from src.models import (
     ResumeData, ContactInfo, Experience, Education, Skills, 
@@ -150,6 +151,89 @@ class TestATSFormatter:
         assert len(formatted_resume.education) == 1
         assert formatted_resume.skills is not None
     
+    def test_format_resume_leaves_input_unchanged(self, sample_resume) -> None:
+        """Test formatting does not modify the original resume data."""
+        sample_resume.skills.categories[0].skills.append("C#")
+        sample_resume.experience[0].company = "Tech Corp\u2122"
+        original = sample_resume.model_dump()
+        
+        formatter = ATSFormatter()
+        formatted_resume = formatter.format_resume(sample_resume)
+        
+        assert sample_resume.model_dump() == original
+        assert "C" in formatted_resume.skills.categories[0].skills
+        assert formatted_resume.experience[0].company == "Tech Corp"
+    
+    def test_format_resume_cached(self, sample_resume) -> None:
+        """Test cached formatting reuses results but returns fresh copies."""
+        formatter = ATSFormatter()
+        
+        with patch.object(formatter, 'format_resume', wraps=formatter.format_resume) as format_mock:
+            first = formatter.format_resume_cached(sample_resume)
+            second = formatter.format_resume_cached(sample_resume.model_copy(deep=True))
+        
+        assert format_mock.call_count == 1
+        assert first == second
+        assert first is not second
+        assert first == formatter.format_resume(sample_resume)
+    
+    def test_format_resume_cached_isolated_from_callers(self, sample_resume) -> None:
+        """Test mutating inputs or results does not leak into later cache hits."""
+        formatter = ATSFormatter()
+        pristine = sample_resume.model_copy(deep=True)
+        
+        first = formatter.format_resume_cached(sample_resume)
+        sample_resume.contact.name = "Mallory"
+        sample_resume.additional_sections = {"Leaked": ["INJECTED"]}
+        first.experience[0].bullets.append("INJECTED")
+        
+        hit = formatter.format_resume_cached(pristine)
+        assert hit == formatter.format_resume(pristine)
+        assert hit.contact.name == "John Doe"
+        assert "INJECTED" not in hit.experience[0].bullets
+    
+    def test_format_resume_cached_keys_on_content(self, sample_resume) -> None:
+        """Test cached formatting misses when content or config changes."""
+        formatter = ATSFormatter()
+        formatter.format_resume_cached(sample_resume)
+        
+        sample_resume.summary = "Engineer focused on distributed systems"
+        changed = formatter.format_resume_cached(sample_resume)
+        assert changed.summary == "Engineer focused on distributed systems"
+        
+        formatter.config.max_line_length = 20
+        wrapped = formatter.format_resume_cached(sample_resume)
+        assert "\n" in wrapped.summary
+    
+    def test_format_resume_output_is_independent(self, sample_resume) -> None:
+        """Test mutating the formatted resume leaves the input unchanged."""
+        sample_resume.additional_sections = {"Volunteering": ["Food bank"]}
+        formatter = ATSFormatter()
+        formatted_once = formatter.format_resume(sample_resume)
+        original = formatted_once.model_dump()
+        
+        formatted_twice = formatter.format_resume(formatted_once)
+        formatted_twice.contact.name = "Mallory"
+        formatted_twice.experience[0].bullets.append("INJECTED")
+        formatted_twice.skills.categories[0].skills.append("INJECTED")
+        formatted_twice.additional_sections["Volunteering"].append("INJECTED")
+        
+        assert formatted_once.model_dump() == original
+    
+    def test_format_resume_copies_clean_entries(self, sample_resume) -> None:
+        """Test clean entries are shared by the helpers but not by format_resume."""
+        formatter = ATSFormatter()
+        clean_resume = formatter.format_resume(sample_resume)
+        clean_experience = clean_resume.experience[0]
+        
+        assert formatter._format_experience(clean_experience) is clean_experience
+        
+        formatted = formatter.format_resume(clean_resume)
+        formatted.experience[0].bullets.append("INJECTED")
+        
+        assert formatted.experience[0] is not clean_experience
+        assert "INJECTED" not in clean_experience.bullets
+    
     def test_format_resume_invalid_input(self) -> None:
         """Test formatter with invalid input."""
         formatter = ATSFormatter()
@@ -245,6 +329,63 @@ class TestATSFormatter:
         assert " - " in cleaned_text  # em dash replaced
         assert "..." in cleaned_text  # ellipsis replaced
     
+    def test_special_chars_cleaning_typographic(self) -> None:
+        """Test typographic quotes, dashes and ellipses are normalized."""
+        formatter = ATSFormatter()
+        text = '\u201cLed\u201d the team\u2019s 2020\u20132021 launch\u2026'
+        
+        cleaned_text = formatter._clean_special_chars(text)
+        
+        assert cleaned_text == "Led the teams 2020-2021 launch..."
+    
+    @pytest.mark.parametrize("text,expected", [
+        ("Senior Software Engineer", "Senior Software Engineer"),
+        ("CI/CD (GitHub), 3.5 yrs - R&D", "CI/CD (GitHub), 3.5 yrs - R&D"),
+        ("Tech  Corp", "Tech Corp"),
+        (" Tech Corp", "Tech Corp"),
+        ("Tech\tCorp\n", "Tech Corp"),
+        ("C++ & C#", "C & C"),
+    ])
+    def test_clean_special_chars_ascii(self, text, expected) -> None:
+        """Test ASCII text is returned as-is only when already clean."""
+        formatter = ATSFormatter()
+        
+        cleaned_text = formatter._clean_special_chars(text)
+        
+        assert cleaned_text == expected
+        if text == expected:
+            assert cleaned_text is text
+    
+    @pytest.mark.parametrize("texts", [
+        ["Python", "C++", "  Node.js ", "CI/CD", "\u201cGo\u201d \u2013 gRPC"],
+        ["Rust", "bad\x00value", "C#"],
+        ["***"],
+    ])
+    def test_clean_special_chars_list(self, texts) -> None:
+        """Test list cleaning matches cleaning each text separately."""
+        formatter = ATSFormatter()
+        
+        expected = [formatter._clean_special_chars(text) for text in texts]
+        assert formatter._clean_special_chars_list(texts) == expected
+    
+    def test_format_without_cleaning_skips_copies(self, sample_contact) -> None:
+        """Test entries are only copied when a formatted value changes."""
+        formatter = ATSFormatter(ATSConfig(remove_special_chars=False))
+        undated_education = Education(degree="BSc", school="State University")
+        standard_education = Education(degree="BSc", school="State University", end_date="May 2018")
+        dated_education = Education(degree="BSc", school="State University", end_date="Jan 2018")
+        plain_project = Project(name="Resume Tool")
+        
+        assert formatter._format_contact(sample_contact) is sample_contact
+        assert formatter._format_education(undated_education) is undated_education
+        assert formatter._format_education(standard_education) is standard_education
+        assert formatter._format_project(plain_project) is plain_project
+        
+        formatted_education = formatter._format_education(dated_education)
+        assert formatted_education is not dated_education
+        assert formatted_education.end_date == "January 2018"
+        assert dated_education.end_date == "Jan 2018"
+    
     def test_header_standardization(self) -> None:
         """Test section header standardization."""
         formatter = ATSFormatter()
@@ -292,6 +433,19 @@ class TestATSFormatter:
         )
         assert formatter.validate_ats_compliance(incomplete_resume) is False
     
+    @pytest.mark.parametrize("bullet,expected", [
+        ("x" * 80, True),
+        ("x" * 81, False),
+        ("short line\n" + "x" * 80, True),
+        ("short line\n" + "x" * 81, False),
+    ])
+    def test_ats_compliance_line_length(self, sample_resume, bullet, expected) -> None:
+        """Test ATS compliance checks every line of multi-line content."""
+        formatter = ATSFormatter()
+        sample_resume.experience[1].bullets = ["Built services", bullet]
+        
+        assert formatter.validate_ats_compliance(sample_resume) is expected
+    
     def test_format_with_projects(self) -> None:
         """Test formatting with projects section."""
         project = Project(
@@ -388,6 +542,14 @@ class TestATSFormatter:
         result = formatter._wrap_text(short_text)
         assert result == short_text
     
+    def test_wrap_text_single_long_token(self) -> None:
+        """Test a long token without whitespace is left on one line."""
+        formatter = ATSFormatter()
+        url = "https://example.com/" + "a" * 100
+        
+        assert formatter._wrap_text(url) == url
+        assert formatter._wrap_text(f"  {url}\n") == url
+    
     def test_config_section_order_default(self) -> None:
         """Test that default section order is set correctly."""
         config = ATSConfig()
@@ -398,6 +560,16 @@ class TestATSFormatter:
         ]
         assert config.section_order == expected_order
     
+    def test_config_uses_slots(self) -> None:
+        """Test ATSConfig stays mutable but rejects unknown attributes."""
+        config = ATSConfig()
+        config.max_line_length = 100
+        
+        assert not hasattr(config, "__dict__")
+        assert config.max_line_length == 100
+        with pytest.raises(AttributeError):
+            config.max_line_lenght = 60  # type: ignore[attr-defined]
+    
     def test_optimize_bullet_points_empty(self) -> None:
         """Test bullet point optimization with empty input."""
         formatter = ATSFormatter()
@@ -7,6 +7,7 @@ date format standardization for ATS compliance.
 
 import pytest
 from src.formatter import DateStandardizer
+from src.formatter import date_standardizer as date_module
 
 
 class TestDateStandardizer:
@@ -111,6 +112,18 @@ class TestDateStandardizer:
             # Should return the cleaned original if no pattern matches
             assert result == invalid_date
     
+    def test_standardize_date_memoized_across_instances(self) -> None:
+        """Test repeated dates are served from the shared parse cache."""
+        date_module._standardize_date.cache_clear()
+        
+        first = DateStandardizer().standardize_date("  Jan 2020 - Present ")
+        second = DateStandardizer().standardize_date("Jan 2020 - Present")
+        
+        assert first == second == "January 2020 - Present"
+        cache_info = date_module._standardize_date.cache_info()
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+    
     def test_standardize_date_range_method(self, date_standardizer) -> None:
         """Test the standardize_date_range method."""
         start_date = "Jan 2020"
@@ -192,6 +205,9 @@ class TestDateStandardizer:
         non_present = ["December 2021", "2021", "Not present", ""]
         for non_present_date in non_present:
             assert date_standardizer._is_present_date(non_present_date) is False
+        
+        # Padding around a present variation is ignored
+        assert date_standardizer._is_present_date("  Present\t ") is True
     
     def test_standardize_month_mapping(self, date_standardizer) -> None:
         """Test individual month standardization."""
@@ -225,22 +241,20 @@ class TestDateStandardizer:
         assert "January 2020" in result
         assert "December" in result
     
-    def test_format_matched_date_edge_cases(self, date_standardizer) -> None:
+    def test_format_date_match_edge_cases(self, date_standardizer) -> None:
         """Test edge cases in date formatting."""
-        # Test with different group lengths
-        groups_1 = ("2020",)
-        result = date_standardizer._format_matched_date(groups_1, "2020")
-        assert result == "2020"
-        
-        # Test 3-group year format
-        groups_3_year = ("2020", "2021", "present")
-        result = date_standardizer._format_matched_date(groups_3_year, "2020-present")
-        assert result == "2020 - Present"
-        
-        # Test 3-group month format
-        groups_3_month = ("January", "2020", "present")
-        result = date_standardizer._format_matched_date(groups_3_month, "January 2020-present")
+        # Single year
+        assert date_standardizer.standardize_date("2020") == "2020"
+        
+        # Year to present without spaces around the separator
+        assert date_standardizer.standardize_date("2020-present") == "2020 - Present"
+        
+        # Month year to present without spaces around the separator
+        result = date_standardizer.standardize_date("January 2020-present")
         assert result == "January 2020 - Present"
+        
+        # Two bare years are treated as a year range
+        assert date_standardizer.standardize_date("2019 2020") == "2019 - 2020"
     
     def test_validate_date_order_exception_handling(self, date_standardizer) -> None:
         """Test date order validation with exception cases."""
@@ -403,4 +403,13 @@ class TestValidationResult:
         assert result.valid is False
         assert len(result.errors) == 2
         assert "Email is required" in result.errors
-        assert "Name is too short" in result.errors
\ No newline at end of file
+        assert "Name is too short" in result.errors
+
+    def test_validation_result_uses_slots(self):
+        """Test ValidationResult stores fields in slots, not an instance dict."""
+        result = ValidationResult(valid=True, errors=[])
+
+        assert not hasattr(result, "__dict__")
+        assert result.warnings is None
+        with pytest.raises(AttributeError):
+            result.extra = "not allowed"